@@ -9,15 +9,19 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 from homeassistant.components.number import NumberMode, RestoreNumber
 from homeassistant.const import EntityCategory
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_call_later
 
 from .const import DOMAIN, MAX_VOLUME_STEP_INTERVAL
 from .helpers import require_unique_id
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 
     from .bravia_grpc_client import BraviaGrpcClientAsync
     from .bravia_quad_client import BraviaQuadClient
@@ -29,6 +33,10 @@ _LOGGER = logging.getLogger(__name__)
 # notifications from snapping the slider back to an intermediate value.
 TRANSITION_NOTIFICATION_GRACE_PERIOD = 0.5
 
+# Window (seconds) used by entities that coalesce notification bursts, e.g.
+# power flapping while the device boots.  Only the latest value is applied.
+NOTIFICATION_DEBOUNCE_SECONDS = 0.05
+
 
 def entity_unique_id(entry: ConfigEntry, suffix: str) -> str:
     """Return entity unique_id as ``{config_entry.unique_id}_{suffix}``."""
@@ -94,25 +102,65 @@ class BraviaQuadNotificationMixin(BraviaQuadAvailabilityMixin):
     - _client: BraviaQuadClient instance
     - _notification_feature: str - the feature name to subscribe to
     - _on_notification: async callback method to handle notifications
+
+    Subclasses may set _notification_debounce (seconds) to coalesce bursts
+    of notifications so only the latest value in the window is applied.
     """
 
     _notification_feature: str
+    _notification_debounce: float = 0.0
+    _pending_notification: str | None = None
+    _cancel_notification_flush: CALLBACK_TYPE | None = None
 
     async def _on_notification(self, value: str) -> None:
         """Handle notification callback. Override in subclass."""
         raise NotImplementedError
 
+    async def _async_handle_notification(self, value: str) -> None:
+        """Apply a notification now or coalesce it within the debounce window."""
+        if self._notification_debounce <= 0:
+            await self._on_notification(value)
+            return
+        self._pending_notification = value
+        if self._cancel_notification_flush is None:
+            self._cancel_notification_flush = async_call_later(
+                self.hass,
+                self._notification_debounce,
+                self._async_flush_pending_notification,
+            )
+
+    async def _async_flush_pending_notification(self, _now: datetime) -> None:
+        """Apply the latest notification received during the debounce window."""
+        self._cancel_notification_flush = None
+        value, self._pending_notification = self._pending_notification, None
+        if value is not None:
+            await self._on_notification(value)
+
+    @callback
+    def _cancel_pending_notification(self) -> None:
+        """
+        Drop any notification still waiting for its debounce window.
+
+        Command paths call this before writing their own state so a stale
+        value received just before the command cannot flip it back.
+        """
+        if self._cancel_notification_flush is not None:
+            self._cancel_notification_flush()
+            self._cancel_notification_flush = None
+        self._pending_notification = None
+
     async def async_added_to_hass(self) -> None:
         """Register notification callback when entity is added."""
         await super().async_added_to_hass()
         self._client.register_notification_callback(
-            self._notification_feature, self._on_notification
+            self._notification_feature, self._async_handle_notification
         )
         self.async_on_remove(
             lambda: self._client.unregister_notification_callback(
-                self._notification_feature, self._on_notification
+                self._notification_feature, self._async_handle_notification
             )
         )
+        self.async_on_remove(self._cancel_pending_notification)
 
 
 class BraviaGrpcAvailabilityMixin(Entity):
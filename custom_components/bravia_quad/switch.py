@@ -49,6 +49,7 @@ from .const import (
     VOICE_ZOOM_ON,
 )
 from .entity import (
+    NOTIFICATION_DEBOUNCE_SECONDS,
     BraviaQuadNotificationMixin,
     entity_unique_id,
     get_device_info,
@@ -64,6 +65,7 @@ from .helpers import (
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceInfo
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from . import BraviaQuadConfigEntry
@@ -113,21 +115,30 @@ async def async_setup_entry(
         return
     client = data.tcp_client
 
-    entities = [
-        BraviaQuadPowerSwitch(client, entry),
-        BraviaQuadHdmiCecSwitch(client, entry),
-        BraviaQuadAutoStandbySwitch(client, entry),
-        BraviaQuadVoiceEnhancerSwitch(client, entry),
-        BraviaQuadSoundFieldSwitch(client, entry),
-        BraviaQuadNightModeSwitch(client, entry),
-        BraviaQuadAdvancedAutoVolumeSwitch(client, entry),
-        BraviaQuadAutoUpdateSwitch(client, entry),
-        BraviaQuadNetBtStandbySwitch(client, entry),
-        BraviaQuadVoiceZoomSwitch(client, entry),
-        BraviaQuadExternalControlSwitch(client, entry),
+    # Device info is identical for every switch; build it once per setup.
+    device_info = get_device_info(entry)
+    # Seeded from the sticky cache that async_fetch_all_states() refreshed
+    # during setup, so re-reading each feature before add would only repeat
+    # the same round trips.
+    cached_entities = [
+        BraviaQuadPowerSwitch(client, entry, device_info),
+        BraviaQuadHdmiCecSwitch(client, entry, device_info),
+        BraviaQuadAutoStandbySwitch(client, entry, device_info),
+        BraviaQuadVoiceEnhancerSwitch(client, entry, device_info),
+        BraviaQuadSoundFieldSwitch(client, entry, device_info),
+        BraviaQuadNightModeSwitch(client, entry, device_info),
+        BraviaQuadAdvancedAutoVolumeSwitch(client, entry, device_info),
+        BraviaQuadAutoUpdateSwitch(client, entry, device_info),
+        BraviaQuadVoiceZoomSwitch(client, entry, device_info),
+    ]
+    # Not part of the sticky cache; read once before add.
+    uncached_entities = [
+        BraviaQuadNetBtStandbySwitch(client, entry, device_info),
+        BraviaQuadExternalControlSwitch(client, entry, device_info),
     ]
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(cached_entities)
+    async_add_entities(uncached_entities, update_before_add=True)
 
 
 class BraviaQuadPowerSwitch(BraviaQuadNotificationMixin, SwitchEntity):
@@ -139,23 +150,33 @@ class BraviaQuadPowerSwitch(BraviaQuadNotificationMixin, SwitchEntity):
     _attr_should_poll = False
     _attr_translation_key = "power"
     _notification_feature = FEATURE_POWER
-
-    def __init__(self, client: BraviaQuadClient, entry: ConfigEntry) -> None:
+    _notification_debounce = NOTIFICATION_DEBOUNCE_SECONDS
+
+    def __init__(
+        self,
+        client: BraviaQuadClient,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the switch."""
         self._client = client
         self._attr_unique_id = entity_unique_id(entry, "power")
         self._attr_is_on = client.power_state == POWER_ON
-        self._attr_device_info = get_device_info(entry)
+        self._attr_device_info = device_info
 
     async def _on_notification(self, value: str) -> None:
         """Handle power state notification."""
-        self._attr_is_on = value == POWER_ON
+        is_on = value == POWER_ON
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
         self.async_write_ha_state()
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn the device on."""
         success = await self._client.async_set_power(POWER_ON)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = True
             self.async_write_ha_state()
         else:
@@ -165,6 +186,7 @@ class BraviaQuadPowerSwitch(BraviaQuadNotificationMixin, SwitchEntity):
         """Turn the device off."""
         success = await self._client.async_set_power(POWER_OFF)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = False
             self.async_write_ha_state()
         else:
@@ -187,23 +209,33 @@ class BraviaQuadHdmiCecSwitch(BraviaQuadNotificationMixin, SwitchEntity):
     _attr_should_poll = False
     _attr_translation_key = "hdmi_cec"
     _notification_feature = FEATURE_HDMI_CEC
-
-    def __init__(self, client: BraviaQuadClient, entry: ConfigEntry) -> None:
+    _notification_debounce = NOTIFICATION_DEBOUNCE_SECONDS
+
+    def __init__(
+        self,
+        client: BraviaQuadClient,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the HDMI CEC switch."""
         self._client = client
         self._attr_unique_id = entity_unique_id(entry, "hdmi_cec")
         self._attr_is_on = client.hdmi_cec == HDMI_CEC_ON
-        self._attr_device_info = get_device_info(entry)
+        self._attr_device_info = device_info
 
     async def _on_notification(self, value: str) -> None:
         """Handle HDMI CEC notification."""
-        self._attr_is_on = value == HDMI_CEC_ON
+        is_on = value == HDMI_CEC_ON
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
         self.async_write_ha_state()
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Enable HDMI CEC."""
         success = await self._client.async_set_hdmi_cec(HDMI_CEC_ON)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = True
             self.async_write_ha_state()
         else:
@@ -213,6 +245,7 @@ class BraviaQuadHdmiCecSwitch(BraviaQuadNotificationMixin, SwitchEntity):
         """Disable HDMI CEC."""
         success = await self._client.async_set_hdmi_cec(HDMI_CEC_OFF)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = False
             self.async_write_ha_state()
         else:
@@ -235,23 +268,33 @@ class BraviaQuadAutoStandbySwitch(BraviaQuadNotificationMixin, SwitchEntity):
     _attr_should_poll = False
     _attr_translation_key = "auto_standby"
     _notification_feature = FEATURE_AUTO_STANDBY
-
-    def __init__(self, client: BraviaQuadClient, entry: ConfigEntry) -> None:
+    _notification_debounce = NOTIFICATION_DEBOUNCE_SECONDS
+
+    def __init__(
+        self,
+        client: BraviaQuadClient,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the auto standby switch."""
         self._client = client
         self._attr_unique_id = entity_unique_id(entry, "auto_standby")
         self._attr_is_on = client.auto_standby == AUTO_STANDBY_ON
-        self._attr_device_info = get_device_info(entry)
+        self._attr_device_info = device_info
 
     async def _on_notification(self, value: str) -> None:
         """Handle auto standby notification."""
-        self._attr_is_on = value == POWER_ON
+        is_on = value == POWER_ON
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
         self.async_write_ha_state()
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Enable auto standby."""
         success = await self._client.async_set_auto_standby(AUTO_STANDBY_ON)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = True
             self.async_write_ha_state()
         else:
@@ -261,6 +304,7 @@ class BraviaQuadAutoStandbySwitch(BraviaQuadNotificationMixin, SwitchEntity):
         """Disable auto standby."""
         success = await self._client.async_set_auto_standby(AUTO_STANDBY_OFF)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = False
             self.async_write_ha_state()
         else:
@@ -283,23 +327,33 @@ class BraviaQuadVoiceEnhancerSwitch(BraviaQuadNotificationMixin, SwitchEntity):
     _attr_should_poll = False
     _attr_translation_key = "voice_enhancer"
     _notification_feature = FEATURE_VOICE_ENHANCER
-
-    def __init__(self, client: BraviaQuadClient, entry: ConfigEntry) -> None:
+    _notification_debounce = NOTIFICATION_DEBOUNCE_SECONDS
+
+    def __init__(
+        self,
+        client: BraviaQuadClient,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the voice enhancer switch."""
         self._client = client
         self._attr_unique_id = entity_unique_id(entry, "voice_enhancer")
         self._attr_is_on = client.voice_enhancer == VOICE_ENHANCER_ON
-        self._attr_device_info = get_device_info(entry)
+        self._attr_device_info = device_info
 
     async def _on_notification(self, value: str) -> None:
         """Handle voice enhancer state notification."""
-        self._attr_is_on = value == VOICE_ENHANCER_ON
+        is_on = value == VOICE_ENHANCER_ON
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
         self.async_write_ha_state()
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn voice enhancer on."""
         success = await self._client.async_set_voice_enhancer(VOICE_ENHANCER_ON)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = True
             self.async_write_ha_state()
         else:
@@ -309,6 +363,7 @@ class BraviaQuadVoiceEnhancerSwitch(BraviaQuadNotificationMixin, SwitchEntity):
         """Turn voice enhancer off."""
         success = await self._client.async_set_voice_enhancer(VOICE_ENHANCER_OFF)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = False
             self.async_write_ha_state()
         else:
@@ -331,23 +386,33 @@ class BraviaQuadSoundFieldSwitch(BraviaQuadNotificationMixin, SwitchEntity):
     _attr_should_poll = False
     _attr_translation_key = "sound_field"
     _notification_feature = FEATURE_SOUND_FIELD
-
-    def __init__(self, client: BraviaQuadClient, entry: ConfigEntry) -> None:
+    _notification_debounce = NOTIFICATION_DEBOUNCE_SECONDS
+
+    def __init__(
+        self,
+        client: BraviaQuadClient,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the sound field switch."""
         self._client = client
         self._attr_unique_id = entity_unique_id(entry, "sound_field")
         self._attr_is_on = client.sound_field == SOUND_FIELD_ON
-        self._attr_device_info = get_device_info(entry)
+        self._attr_device_info = device_info
 
     async def _on_notification(self, value: str) -> None:
         """Handle sound field state notification."""
-        self._attr_is_on = value == SOUND_FIELD_ON
+        is_on = value == SOUND_FIELD_ON
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
         self.async_write_ha_state()
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn sound field on."""
         success = await self._client.async_set_sound_field(SOUND_FIELD_ON)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = True
             self.async_write_ha_state()
         else:
@@ -357,6 +422,7 @@ class BraviaQuadSoundFieldSwitch(BraviaQuadNotificationMixin, SwitchEntity):
         """Turn sound field off."""
         success = await self._client.async_set_sound_field(SOUND_FIELD_OFF)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = False
             self.async_write_ha_state()
         else:
@@ -379,23 +445,33 @@ class BraviaQuadNightModeSwitch(BraviaQuadNotificationMixin, SwitchEntity):
     _attr_should_poll = False
     _attr_translation_key = "night_mode"
     _notification_feature = FEATURE_NIGHT_MODE
-
-    def __init__(self, client: BraviaQuadClient, entry: ConfigEntry) -> None:
+    _notification_debounce = NOTIFICATION_DEBOUNCE_SECONDS
+
+    def __init__(
+        self,
+        client: BraviaQuadClient,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the night mode switch."""
         self._client = client
         self._attr_unique_id = entity_unique_id(entry, "night_mode")
         self._attr_is_on = client.night_mode == NIGHT_MODE_ON
-        self._attr_device_info = get_device_info(entry)
+        self._attr_device_info = device_info
 
     async def _on_notification(self, value: str) -> None:
         """Handle night mode state notification."""
-        self._attr_is_on = value == NIGHT_MODE_ON
+        is_on = value == NIGHT_MODE_ON
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
         self.async_write_ha_state()
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn night mode on."""
         success = await self._client.async_set_night_mode(NIGHT_MODE_ON)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = True
             self.async_write_ha_state()
         else:
@@ -405,6 +481,7 @@ class BraviaQuadNightModeSwitch(BraviaQuadNotificationMixin, SwitchEntity):
         """Turn night mode off."""
         success = await self._client.async_set_night_mode(NIGHT_MODE_OFF)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = False
             self.async_write_ha_state()
         else:
@@ -427,24 +504,34 @@ class BraviaQuadAdvancedAutoVolumeSwitch(BraviaQuadNotificationMixin, SwitchEnti
     _attr_should_poll = False
     _attr_translation_key = "auto_volume"
     _notification_feature = FEATURE_AAV
-
-    def __init__(self, client: BraviaQuadClient, entry: ConfigEntry) -> None:
+    _notification_debounce = NOTIFICATION_DEBOUNCE_SECONDS
+
+    def __init__(
+        self,
+        client: BraviaQuadClient,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the Advanced Auto Volume switch."""
         self._client = client
         self._attr_unique_id = entity_unique_id(entry, "advanced_auto_volume")
         # Initialize from client's current state
         self._attr_is_on = client.aav == AAV_ON
-        self._attr_device_info = get_device_info(entry)
+        self._attr_device_info = device_info
 
     async def _on_notification(self, value: str) -> None:
         """Handle Advanced Auto Volume state notification."""
-        self._attr_is_on = value == AAV_ON
+        is_on = value == AAV_ON
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
         self.async_write_ha_state()
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn Advanced Auto Volume on."""
         success = await self._client.async_set_aav(AAV_ON)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = True
             self.async_write_ha_state()
         else:
@@ -454,6 +541,7 @@ class BraviaQuadAdvancedAutoVolumeSwitch(BraviaQuadNotificationMixin, SwitchEnti
         """Turn Advanced Auto Volume off."""
         success = await self._client.async_set_aav(AAV_OFF)
         if success:
+            self._cancel_pending_notification()
             self._attr_is_on = False
             self.async_write_ha_state()
         else:
@@ -476,17 +564,26 @@ class BraviaQuadAutoUpdateSwitch(BraviaQuadNotificationMixin, SwitchEntity):
     _attr_should_poll = False
     _attr_translation_key = "auto_update"
     _notification_feature = FEATURE_AUTO_UPDATE
-
-    def __init__(self, client: BraviaQuadClient, entry: ConfigEntry) -> None:
+    _notification_debounce = NOTIFICATION_DEBOUNCE_SECONDS
+
+    def __init__(
+        self,
+        client: BraviaQuadClient,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the auto update switch."""
         self._client = client
         self._attr_unique_id = entity_unique_id(entry, "auto_update")
         self._attr_is_on = client.auto_update == AUTO_UPDATE_ON
-        self._attr_device_info = get_device_info(entry)
+        self._attr_device_info = device_info
 
     async def _on_notification(self, value: str) -> None:
         """Handle auto update notification."""
-        self._attr_is_on = value == AUTO_UPDATE_ON
+        is_on = value == AUTO_UPDATE_ON
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
         self.async_write_ha_state()
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
@@ -506,6 +603,7 @@ class BraviaQuadAutoUpdateSwitch(BraviaQuadNotificationMixin, SwitchEntity):
                     "requested": requested,
                 },
             ) from err
+        self._cancel_pending_notification()
         self._attr_is_on = actual == AUTO_UPDATE_ON
         verify_feature_value(
             requested=requested,
@@ -532,6 +630,7 @@ class BraviaQuadAutoUpdateSwitch(BraviaQuadNotificationMixin, SwitchEntity):
                     "requested": requested,
                 },
             ) from err
+        self._cancel_pending_notification()
         self._attr_is_on = actual == AUTO_UPDATE_ON
         verify_feature_value(
             requested=requested,
@@ -558,17 +657,25 @@ class BraviaQuadNetBtStandbySwitch(BraviaQuadNotificationMixin, SwitchEntity):
     _attr_should_poll = True
     _attr_translation_key = "net_bt_standby"
     _notification_feature = FEATURE_NET_BT_STANDBY
-
-    def __init__(self, client: BraviaQuadClient, entry: ConfigEntry) -> None:
+    _notification_debounce = NOTIFICATION_DEBOUNCE_SECONDS
+
+    def __init__(
+        self,
+        client: BraviaQuadClient,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the network/Bluetooth standby switch."""
         self._client = client
         self._attr_unique_id = entity_unique_id(entry, "net_bt_standby")
-        self._attr_is_on = None
-        self._attr_device_info = get_device_info(entry)
+        self._attr_device_info = device_info
 
     async def _on_notification(self, value: str) -> None:
         """Handle network/Bluetooth standby notification."""
-        self._attr_is_on = value == NET_BT_STANDBY_ON
+        is_on = value == NET_BT_STANDBY_ON
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
         self.async_write_ha_state()
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
@@ -588,6 +695,7 @@ class BraviaQuadNetBtStandbySwitch(BraviaQuadNotificationMixin, SwitchEntity):
                     "requested": requested,
                 },
             ) from err
+        self._cancel_pending_notification()
         self._attr_is_on = actual == NET_BT_STANDBY_ON
         verify_feature_value(
             requested=requested,
@@ -614,6 +722,7 @@ class BraviaQuadNetBtStandbySwitch(BraviaQuadNotificationMixin, SwitchEntity):
                     "requested": requested,
                 },
             ) from err
+        self._cancel_pending_notification()
         self._attr_is_on = actual == NET_BT_STANDBY_ON
         verify_feature_value(
             requested=requested,
@@ -641,17 +750,26 @@ class BraviaQuadVoiceZoomSwitch(BraviaQuadNotificationMixin, SwitchEntity):
     _attr_should_poll = False
     _attr_translation_key = "voice_zoom"
     _notification_feature = FEATURE_VOICE_ZOOM
-
-    def __init__(self, client: BraviaQuadClient, entry: ConfigEntry) -> None:
+    _notification_debounce = NOTIFICATION_DEBOUNCE_SECONDS
+
+    def __init__(
+        self,
+        client: BraviaQuadClient,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the voice zoom switch."""
         self._client = client
         self._attr_unique_id = entity_unique_id(entry, "voice_zoom")
         self._attr_is_on = client.voice_zoom == VOICE_ZOOM_ON
-        self._attr_device_info = get_device_info(entry)
+        self._attr_device_info = device_info
 
     async def _on_notification(self, value: str) -> None:
         """Handle voice zoom notification."""
-        self._attr_is_on = value == VOICE_ZOOM_ON
+        is_on = value == VOICE_ZOOM_ON
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
         self.async_write_ha_state()
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
@@ -677,6 +795,7 @@ class BraviaQuadVoiceZoomSwitch(BraviaQuadNotificationMixin, SwitchEntity):
             self._attr_is_on = value == VOICE_ZOOM_ON
         except (OSError, TimeoutError):
             pass
+        self._cancel_pending_notification()
         self.async_write_ha_state()
 
     async def async_update(self) -> None:
@@ -697,17 +816,25 @@ class BraviaQuadExternalControlSwitch(BraviaQuadNotificationMixin, SwitchEntity)
     _attr_should_poll = True
     _attr_translation_key = "external_control"
     _notification_feature = FEATURE_EXTERNAL_CONTROL
-
-    def __init__(self, client: BraviaQuadClient, entry: ConfigEntry) -> None:
+    _notification_debounce = NOTIFICATION_DEBOUNCE_SECONDS
+
+    def __init__(
+        self,
+        client: BraviaQuadClient,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the external control switch."""
         self._client = client
         self._attr_unique_id = entity_unique_id(entry, "external_control")
-        self._attr_is_on = None
-        self._attr_device_info = get_device_info(entry)
+        self._attr_device_info = device_info
 
     async def _on_notification(self, value: str) -> None:
         """Handle external control notification."""
-        self._attr_is_on = value == EXTERNAL_CONTROL_ON
+        is_on = value == EXTERNAL_CONTROL_ON
+        if is_on == self._attr_is_on:
+            return
+        self._attr_is_on = is_on
         self.async_write_ha_state()
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
@@ -727,6 +854,7 @@ class BraviaQuadExternalControlSwitch(BraviaQuadNotificationMixin, SwitchEntity)
                     "requested": requested,
                 },
             ) from err
+        self._cancel_pending_notification()
         self._attr_is_on = actual == EXTERNAL_CONTROL_ON
         verify_feature_value(
             requested=requested,
@@ -753,6 +881,7 @@ class BraviaQuadExternalControlSwitch(BraviaQuadNotificationMixin, SwitchEntity)
                     "requested": requested,
                 },
             ) from err
+        self._cancel_pending_notification()
         self._attr_is_on = actual == EXTERNAL_CONTROL_ON
         verify_feature_value(
             requested=requested,
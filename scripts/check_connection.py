@@ -11,9 +11,24 @@ Usage:
 
 import json
 import socket
+import struct
 import sys
 
+import orjson
+
 DEFAULT_PORT = 33336
+# l_onoff=1, l_linger=0: close() sends RST so repeated probes leave no
+# TIME_WAIT sockets behind on the caller.
+LINGER_ABORT = struct.pack("ii", 1, 0)
+# Explicit kernel buffer sizes so larger state dumps avoid short reads
+SO_RCVBUF_BYTES = 64 * 1024
+SO_SNDBUF_BYTES = 256 * 1024
+
+# The probe command never changes, so serialize it once at import
+PROBE_COMMAND = orjson.dumps({"id": 3, "type": "get", "feature": "main.power"}) + b"\n"
+
+# Reused receive buffer; replies are parsed straight from a view into it
+_RECV_BUFFER = bytearray(4096)
 
 
 def check_connection(host: str, port: int = DEFAULT_PORT) -> bool:
@@ -32,25 +47,30 @@ def check_connection(host: str, port: int = DEFAULT_PORT) -> bool:
     try:
         # Create socket and connect
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_ABORT)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SO_RCVBUF_BYTES)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SO_SNDBUF_BYTES)
+        # Ship the one-line command immediately instead of waiting on Nagle
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         sock.settimeout(5)
         print(f"Connecting to {host}:{port}...")
         sock.connect((host, port))
         print("Connected successfully!")
 
         # Send test command
-        command = {"id": 3, "type": "get", "feature": "main.power"}
-        command_json = json.dumps(command) + "\n"
-        print(f"Sending: {command_json.strip()}")
-        sock.send(command_json.encode())
+        print(f"Sending: {PROBE_COMMAND.decode().strip()}")
+        sock.sendall(PROBE_COMMAND)
 
         # Receive response
-        response = sock.recv(1024).decode()
-        print(f"Response: {response.strip()}")
+        nbytes = sock.recv_into(_RECV_BUFFER)
+        response = memoryview(_RECV_BUFFER)[:nbytes]
+        print(f"Response: {str(response, errors='replace').strip()}")
 
         # Parse response
         try:
-            response_data = json.loads(response.strip())
-        except json.JSONDecodeError as e:
+            response_data = orjson.loads(response)
+        except orjson.JSONDecodeError as e:
             print(f"Failed to parse response: {e}")
             return False
 
@@ -72,7 +92,7 @@ def check_connection(host: str, port: int = DEFAULT_PORT) -> bool:
     except OSError as e:
         print(f"Error: {e}")
     finally:
-        if sock:
+        if sock is not None:
             sock.close()
             print("Connection closed")
     return False
@@ -1,119 +1,292 @@
 """
 Manual script to verify Bravia Quad connection (async version).
 
-This script tests connectivity to a real Bravia Quad device using asyncio.
-Mimics Home Assistant's async behavior for debugging.
+This script tests connectivity to real Bravia Quad devices using asyncio.
+Mimics Home Assistant's async behavior for debugging. Several hosts are
+probed concurrently, so sweeping a fleet takes about as long as one probe.
 
 Usage:
-    python scripts/check_connection_async.py <host>
-    python scripts/check_connection_async.py 192.168.1.100
+    python scripts/check_connection_async.py <host> [<host> ...] [--port PORT]
+        [--feature FEATURE ...] [-v]
+    python scripts/check_connection_async.py 192.168.1.100 192.168.1.101
+    python scripts/check_connection_async.py 192.168.1.100 --feature main.volumestep
 """
 
+from __future__ import annotations
+
+import argparse
 import asyncio
 import contextlib
+import itertools
 import json
 import logging
+import socket
+import struct
 import sys
-import traceback
+from typing import TYPE_CHECKING, Any, Self
+
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
-logging.basicConfig(level=logging.DEBUG)
+_LOGGER = logging.getLogger(__name__)
 
 DEFAULT_PORT = 33336
+MAX_CONCURRENT_PROBES = 64  # Cap open sockets during large sweeps
+# l_onoff=1, l_linger=0: close() sends RST so sweeps leave no TIME_WAIT
+# sockets behind on the caller.
+LINGER_ABORT = struct.pack("ii", 1, 0)
+# Explicit kernel buffer sizes so larger state dumps avoid short reads
+SO_RCVBUF_BYTES = 64 * 1024
+SO_SNDBUF_BYTES = 256 * 1024
+# Replies are flat JSON objects with no trailing newline
+FRAME_END = b"}"
+
+
+class BraviaProbe:
+    """
+    One connection to a device, reused for every command sent through it.
+
+    Commands are pipelined: each gets a unique ``id``, several can be written
+    in one go, and a background reader routes replies back by that ``id``.
+    """
+
+    def __init__(
+        self, host: str, port: int = DEFAULT_PORT, timeout: float = 10.0
+    ) -> None:
+        """Initialize the probe; the connection opens on ``async with``."""
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._ids = itertools.count(1)
+
+    async def __aenter__(self) -> Self:
+        """Open the connection, tune its socket and start routing replies."""
+        reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), timeout=self.timeout
+        )
+        # Send each one-line command immediately (no Nagle/delayed-ACK stall).
+        # CPython's loop already does this; keep it explicit for other loops.
+        # Buffer sizes are applied here too since open_connection owns the
+        # socket until it is connected.
+        if (sock := self._writer.get_extra_info("socket")) is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SO_RCVBUF_BYTES)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SO_SNDBUF_BYTES)
+        self._reader_task = asyncio.create_task(self._read_replies(reader))
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Abort the connection without leaving TIME_WAIT behind."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader_task
+            self._reader_task = None
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        if (sock := writer.get_extra_info("socket")) is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_ABORT)
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+
+    @staticmethod
+    def _parse_reply(data: bytes) -> dict[str, Any]:
+        """Decode one reply frame, rejecting JSON that is not an object."""
+        reply = orjson.loads(data)
+        if not isinstance(reply, dict):
+            msg = f"Reply is not a JSON object: {reply!r}"
+            raise TypeError(msg)
+        return reply
+
+    async def _read_replies(self, reader: asyncio.StreamReader) -> None:
+        """Resolve the pending command whose ``id`` matches each reply."""
+        try:
+            while True:
+                # Device sends JSON without newline, so read exactly one flat
+                # object up to its closing brace
+                data = await reader.readuntil(FRAME_END)
+                # Raw bytes straight to orjson; only debug output looks at them
+                _LOGGER.debug("[%s] Response: %r", self.host, data[:80])
+                reply = self._parse_reply(data)
+                # Unsolicited notifications carry no id we are waiting on
+                future = self._pending.pop(reply.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(reply)
+        except Exception as err:
+            # Whatever stopped the reader, no further replies will be routed;
+            # fail every waiting command instead of leaving it to time out
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(err)
+            self._pending.clear()
+
+    async def send_many(
+        self, commands: Sequence[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Write all commands at once and return their replies in order.
+
+        Raises:
+            TimeoutError: Not every reply arrived within the probe timeout.
+            asyncio.IncompleteReadError: The device closed mid-reply.
+            asyncio.LimitOverrunError: A reply exceeded the stream buffer.
+            orjson.JSONDecodeError: A reply was not valid JSON.
+            TypeError: A reply was valid JSON but not an object.
+
+        """
+        if (
+            self._writer is None
+            or self._reader_task is None
+            or self._reader_task.done()
+        ):
+            msg = "BraviaProbe is not connected"
+            raise ConnectionError(msg)
+        loop = asyncio.get_running_loop()
+        payload = bytearray()
+        futures: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        for command in commands:
+            command_id = next(self._ids)
+            payload += orjson.dumps({"id": command_id, **command}) + b"\n"
+            futures[command_id] = self._pending[command_id] = loop.create_future()
+        try:
+            self._writer.write(payload)
+            await self._writer.drain()
+            return await asyncio.wait_for(
+                asyncio.gather(*futures.values()), timeout=self.timeout
+            )
+        finally:
+            for command_id in futures:
+                self._pending.pop(command_id, None)
 
+    async def send(self, command: dict[str, Any]) -> dict[str, Any]:
+        """Send one command and return its reply; see ``send_many``."""
+        (reply,) = await self.send_many([command])
+        return reply
 
-async def check_async_connection(host: str, port: int = DEFAULT_PORT) -> bool:
+
+async def check_async_connection(
+    host: str, port: int = DEFAULT_PORT, extra_features: Sequence[str] = ()
+) -> bool:
     """
     Check async connection similar to Home Assistant.
 
     Args:
         host: IP address or hostname of the Bravia Quad device.
         port: Port number (default: 33336).
+        extra_features: Further features to read, pipelined with main.power.
 
     Returns:
         True if connection test passed, False otherwise.
 
     """
-    writer = None
     try:
-        print(f"Connecting to {host}:{port}...")
-        reader, writer = await asyncio.wait_for(
-            asyncio.open_connection(host, port), timeout=10.0
-        )
-        print("Connected successfully!")
+        print(f"[{host}] Connecting on port {port}...")
+        async with BraviaProbe(host, port) as probe:
+            print(f"[{host}] Connected successfully!")
 
-        # Give connection a moment to stabilize
-        await asyncio.sleep(0.2)
+            # Send test command plus any extra reads in a single write
+            commands = [
+                {"type": "get", "feature": feature}
+                for feature in ("main.power", *extra_features)
+            ]
+            for command in commands:
+                print(f"[{host}] Sending: {json.dumps(command)}")
 
-        # Send test command
-        command = {"id": 3, "type": "get", "feature": "main.power"}
-        command_json = json.dumps(command) + "\n"
-        print(f"Sending: {command_json.strip()}")
+            try:
+                response_data, *extra_replies = await probe.send_many(commands)
+            except TimeoutError:
+                print(f"[{host}] Timeout waiting for response")
+                return False
+            except asyncio.IncompleteReadError:
+                print(f"[{host}] Connection closed before a complete response")
+                return False
+            except asyncio.LimitOverrunError:
+                print(f"[{host}] Response exceeded the read buffer")
+                return False
+            except (orjson.JSONDecodeError, TypeError) as e:
+                print(f"[{host}] Failed to parse response: {e}")
+                return False
 
-        writer.write(command_json.encode())
-        await writer.drain()
-        print("Command sent, waiting for response...")
+            print(f"[{host}] Parsed response: {json.dumps(response_data, indent=2)}")
+            for feature, reply in zip(extra_features, extra_replies, strict=True):
+                print(f"[{host}] {feature} = {reply.get('value')!r}")
 
-        # Wait for response - device sends JSON without newline
-        try:
-            data = await asyncio.wait_for(reader.read(1024), timeout=10.0)
-        except TimeoutError:
-            print("Timeout waiting for response")
-            return False
+            if (
+                response_data.get("type") == "result"
+                and response_data.get("feature") == "main.power"
+            ):
+                print(f"[{host}] Connection test successful!")
+                return True
 
-        if not data:
-            print("Received empty response")
-            return False
+            print(f"[{host}] Unexpected response format")
 
-        response_str = data.decode("utf-8", errors="replace").strip()
-        print(f"Response: {response_str}")
+    except OSError as e:
+        print(f"[{host}] Error: {e}")
+        import traceback
 
-        try:
-            response_data = json.loads(response_str)
-        except json.JSONDecodeError as e:
-            print(f"Failed to parse response: {e}")
-            return False
+        traceback.print_exc()
+    finally:
+        print(f"[{host}] Connection closed")
+    return False
 
-        print(f"Parsed response: {json.dumps(response_data, indent=2)}")
 
-        if (
-            response_data.get("type") == "result"
-            and response_data.get("feature") == "main.power"
-        ):
-            print("Connection test successful!")
-            return True
+async def check_hosts(
+    hosts: list[str], port: int = DEFAULT_PORT, extra_features: Sequence[str] = ()
+) -> list[bool]:
+    """Probe every host concurrently and return one result per host."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
 
-        print("Unexpected response format")
+    async def _probe(host: str) -> bool:
+        async with semaphore:
+            return await check_async_connection(host, port, extra_features)
 
-    except OSError as e:
-        print(f"Error: {e}")
-        traceback.print_exc()
-    finally:
-        if writer:
-            writer.close()
-            with contextlib.suppress(OSError):
-                await writer.wait_closed()
-        print("Connection closed")
-    return False
+    results = await asyncio.gather(
+        *(_probe(host) for host in hosts), return_exceptions=True
+    )
+    for host, result in zip(hosts, results, strict=True):
+        if isinstance(result, BaseException):
+            print(f"[{host}] Probe failed: {result!r}")
+    return [result is True for result in results]
 
 
 def main() -> None:
-    """Run the async connection check."""
-    if len(sys.argv) < 2:
-        print(f"Usage: {sys.argv[0]} <host> [port]")
-        print(f"Example: {sys.argv[0]} 192.168.1.100")
-        sys.exit(1)
+    """Run the async connection check against one or more hosts."""
+    parser = argparse.ArgumentParser(description="Check Bravia Quad connectivity.")
+    parser.add_argument(
+        "hosts", nargs="+", metavar="host", help="IP address or hostname"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"Port number (default: {DEFAULT_PORT})",
+    )
+    parser.add_argument(
+        "--feature",
+        action="append",
+        default=[],
+        dest="features",
+        help="Extra feature to read after main.power (repeatable)",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Enable debug logging"
+    )
+    args = parser.parse_args()
+    if args.verbose:
+        logging.basicConfig(level=logging.DEBUG)
 
-    host = sys.argv[1]
-    try:
-        port = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PORT
-    except ValueError:
-        print(f"Error: Invalid port number '{sys.argv[2]}'")
-        print(f"Usage: {sys.argv[0]} <host> [port]")
-        sys.exit(1)
-
-    result = asyncio.run(check_async_connection(host, port))
-    print(f"\nResult: {'PASSED' if result else 'FAILED'}")
-    sys.exit(0 if result else 1)
+    results = asyncio.run(check_hosts(args.hosts, args.port, args.features))
+    print()
+    for host, result in zip(args.hosts, results, strict=True):
+        print(f"{host}: {'PASSED' if result else 'FAILED'}")
+    sys.exit(0 if all(results) else 1)
 
 
 if __name__ == "__main__":
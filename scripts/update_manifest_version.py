@@ -23,17 +23,11 @@ def update_version() -> None:
         / "manifest.json"
     )
 
-    # Read the manifest file
-    with manifest_path.open() as f:
-        manifest = json.load(f)
-
-    # Update the version
+    # Read, update and rewrite the manifest in one pass each way. Stdlib json
+    # only: the release workflow runs this with a bare python3.
+    manifest = json.loads(manifest_path.read_bytes())
     manifest["version"] = version
-
-    # Write the manifest file
-    with manifest_path.open("w") as f:
-        json.dump(manifest, f, indent=2)
-        f.write("\n")  # Ensure trailing newline
+    manifest_path.write_bytes(json.dumps(manifest, indent=2).encode() + b"\n")
 
 
 if __name__ == "__main__":
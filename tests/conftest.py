@@ -5,19 +5,22 @@ from __future__ import annotations
 import os
 from pathlib import Path
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, create_autospec, patch
 
 import pytest
 from homeassistant.const import CONF_HOST, Platform
 from homeassistant.helpers import entity_registry as er
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components import bravia_quad
+from custom_components.bravia_quad import config_flow
 from custom_components.bravia_quad.bravia_http_client import (
     DeviceDetails,
     FirmwareUpdateStatus,
     LatestFirmwareInfo,
     SystemInfo,
 )
+from custom_components.bravia_quad.bravia_quad_client import BraviaQuadClient
 from custom_components.bravia_quad.const import (
     CONF_HAS_SUBWOOFER,
     CONF_TRANSPORT,
@@ -26,13 +29,21 @@ from custom_components.bravia_quad.const import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
 
     from homeassistant.core import HomeAssistant
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
+# Shared by every entry; ConfigEntry exposes data read-only, so never mutate
+_ENTRY_DATA = {
+    CONF_HOST: "192.168.1.100",
+    CONF_HAS_SUBWOOFER: True,
+    CONF_TRANSPORT: TRANSPORT_TCP,
+}
+_ENTRY_DATA_NO_SUBWOOFER = {**_ENTRY_DATA, CONF_HAS_SUBWOOFER: False}
+
 
 def frida_fixture_dir() -> Path:
     """Gitignored Frida wire captures; override with BRAVIA_QUAD_FRIDA_FIXTURE_DIR."""
@@ -60,6 +71,19 @@ def get_entity_id_by_unique_id_suffix(
     return None
 
 
+def get_registered_callback(mock_client: MagicMock, feature: str) -> Callable | None:
+    """Get the callback registered for a specific feature.
+
+    Returns the last registered callback for the feature, so a reloaded
+    integration resolves to its current entity rather than the unloaded one.
+    """
+    callbacks = {
+        call_args[0][0]: call_args[0][1]
+        for call_args in mock_client.register_notification_callback.call_args_list
+    }
+    return callbacks.get(feature)
+
+
 async def enable_entity(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
@@ -98,11 +122,7 @@ def mock_config_entry() -> MockConfigEntry:
     return MockConfigEntry(
         title="Bravia Quad",
         domain=DOMAIN,
-        data={
-            CONF_HOST: "192.168.1.100",
-            CONF_HAS_SUBWOOFER: True,
-            CONF_TRANSPORT: TRANSPORT_TCP,
-        },
+        data=_ENTRY_DATA,
         unique_id="192.168.1.100",
         entry_id="test_entry_id",  # Fixed entry_id for stable snapshots
     )
@@ -114,181 +134,103 @@ def mock_config_entry_no_subwoofer() -> MockConfigEntry:
     return MockConfigEntry(
         title="Bravia Quad",
         domain=DOMAIN,
-        data={
-            CONF_HOST: "192.168.1.100",
-            CONF_HAS_SUBWOOFER: False,
-            CONF_TRANSPORT: TRANSPORT_TCP,
-        },
+        data=_ENTRY_DATA_NO_SUBWOOFER,
         unique_id="192.168.1.100",
         entry_id="test_entry_id_no_sub",  # Fixed entry_id for stable snapshots
     )
 
 
 @pytest.fixture
-def mock_setup_entry() -> Generator[None]:
+def mock_setup_entry() -> Generator[AsyncMock]:
     """Mock setting up a config entry."""
     with patch(
         "custom_components.bravia_quad.async_setup_entry",
         return_value=True,
-    ):
-        yield
+    ) as mock_setup:
+        yield mock_setup
+
+
+# (feature, mocked value, cached client attribute or None)
+_READ_WRITE_FEATURES: tuple[tuple[str, object, str | None], ...] = (
+    ("power", "on", "power_state"),
+    ("volume", 50, "volume"),
+    ("input", "tv", "input"),
+    ("rear_level", 0, "rear_level"),
+    ("bass_level", 0, "bass_level"),
+    ("voice_enhancer", "upoff", "voice_enhancer"),
+    ("sound_field", "off", "sound_field"),
+    ("night_mode", "off", "night_mode"),
+    ("drc", "auto", "drc"),
+    ("hdmi_cec", "off", "hdmi_cec"),
+    ("auto_standby", "off", "auto_standby"),
+    ("aav", "off", "aav"),
+    ("mute", "off", "mute"),
+    ("hdmi_passthrough", "auto", None),
+    ("dual_mono", "main", None),
+    ("auto_update", "off", "auto_update"),
+    ("imax_mode", "auto", "imax_mode"),
+    ("av_sync", 0, None),
+    ("tv_av_sync", 0, None),
+    ("bt_connection_quality", "prioritysound", None),
+    ("external_control", "on", None),
+    ("hdmi_standby_link", "auto", None),
+    ("net_bt_standby", "off", None),
+    ("voice_zoom", "off", "voice_zoom"),
+    ("audio_return_channel", "arc", None),
+)
+
+_READ_ONLY_FEATURES: tuple[tuple[str, object, str | None], ...] = (
+    # Device identity
+    ("mac_address", "aa:bb:cc:dd:ee:ff", None),
+    ("serial_number", "1234567", "serial_number"),
+    ("firmware_version", "001.100", "firmware_version"),
+    ("model_type", "HT-A9M2", "model_type"),
+    ("manufacturer", "SONY", "manufacturer"),
+    ("device_name", "Test BRAVIA Theatre Quad", None),
+    ("voice_zoom_level", 1, None),
+    # Diagnostic sensors
+    ("timezone", "America/New_York|-300", None),
+    ("temperature", "F:134,C:57", None),
+    ("360ssm", "on", None),
+    ("network_mode", "wired", None),
+    ("ip_address", "192.168.1.100", None),
+    ("destination", "us", None),
+    ("language", "english", None),
+    ("dhcp", "on", None),
+)
 
 
-def _setup_feature_mocks(client: MagicMock) -> None:  # noqa: PLR0915
+def _setup_feature_mocks(client: MagicMock) -> None:
     """Configure feature-specific mock attributes on the client."""
-    # Power
-    client.async_get_power = AsyncMock(return_value="on")
-    client.async_set_power = AsyncMock(return_value=True)
-    client.power_state = "on"
-
-    # Volume
-    client.async_get_volume = AsyncMock(return_value=50)
-    client.async_set_volume = AsyncMock(return_value=True)
-    client.volume = 50
+    for feature, _, _ in _READ_WRITE_FEATURES:
+        setattr(client, f"async_set_{feature}", AsyncMock(return_value=True))
+    for feature, value, attr in (*_READ_WRITE_FEATURES, *_READ_ONLY_FEATURES):
+        setattr(client, f"async_get_{feature}", AsyncMock(return_value=value))
+        if attr is not None:
+            setattr(client, attr, value)
     client.volume_step_interval = 0
 
-    # Input
-    client.async_get_input = AsyncMock(return_value="tv")
-    client.async_set_input = AsyncMock(return_value=True)
-    client.input = "tv"
-
-    # Rear level
-    client.async_get_rear_level = AsyncMock(return_value=0)
-    client.async_set_rear_level = AsyncMock(return_value=True)
-    client.rear_level = 0
-
-    # Bass level
-    client.async_get_bass_level = AsyncMock(return_value=0)
-    client.async_set_bass_level = AsyncMock(return_value=True)
-    client.bass_level = 0
-
-    # Voice enhancer
-    client.async_get_voice_enhancer = AsyncMock(return_value="upoff")
-    client.async_set_voice_enhancer = AsyncMock(return_value=True)
-    client.voice_enhancer = "upoff"
-
-    # Sound field
-    client.async_get_sound_field = AsyncMock(return_value="off")
-    client.async_set_sound_field = AsyncMock(return_value=True)
-    client.sound_field = "off"
-
-    # Night mode
-    client.async_get_night_mode = AsyncMock(return_value="off")
-    client.async_set_night_mode = AsyncMock(return_value=True)
-    client.night_mode = "off"
-
-    # HDMI CEC
-    client.async_get_hdmi_cec = AsyncMock(return_value="off")
-    client.async_set_hdmi_cec = AsyncMock(return_value=True)
-    client.hdmi_cec = "off"
-
-    # Auto standby
-    client.async_get_auto_standby = AsyncMock(return_value="off")
-    client.async_set_auto_standby = AsyncMock(return_value=True)
-    client.auto_standby = "off"
-
-    # Advanced Auto Volume
-    client.async_get_aav = AsyncMock(return_value="off")
-    client.async_set_aav = AsyncMock(return_value=True)
-    client.aav = "off"
-
-    # Mute
-    client.async_get_mute = AsyncMock(return_value="off")
-    client.async_set_mute = AsyncMock(return_value=True)
-    client.mute = "off"
 
-    # Device identity
-    client.async_get_mac_address = AsyncMock(return_value="aa:bb:cc:dd:ee:ff")
-    client.async_get_serial_number = AsyncMock(return_value="1234567")
-    client.async_get_firmware_version = AsyncMock(return_value="001.100")
-    client.async_get_model_type = AsyncMock(return_value="HT-A9M2")
-    client.async_get_manufacturer = AsyncMock(return_value="SONY")
-    client.serial_number = "1234567"
-    client.firmware_version = "001.100"
-    client.model_type = "HT-A9M2"
-    client.manufacturer = "SONY"
-    client.async_get_device_name = AsyncMock(return_value="Test BRAVIA Theatre Quad")
-
-    # HDMI Passthrough
-    client.async_get_hdmi_passthrough = AsyncMock(return_value="auto")
-    client.async_set_hdmi_passthrough = AsyncMock(return_value=True)
-
-    # Dual Mono
-    client.async_get_dual_mono = AsyncMock(return_value="main")
-    client.async_set_dual_mono = AsyncMock(return_value=True)
-
-    # Auto Update
-    client.async_get_auto_update = AsyncMock(return_value="off")
-    client.async_set_auto_update = AsyncMock(return_value=True)
-    client.auto_update = "off"
-
-    # IMAX Mode
-    client.async_get_imax_mode = AsyncMock(return_value="auto")
-    client.async_set_imax_mode = AsyncMock(return_value=True)
-    client.imax_mode = "auto"
-
-    # AV Sync
-    client.async_get_av_sync = AsyncMock(return_value=0)
-    client.async_set_av_sync = AsyncMock(return_value=True)
-
-    # TV AV Sync
-    client.async_get_tv_av_sync = AsyncMock(return_value=0)
-    client.async_set_tv_av_sync = AsyncMock(return_value=True)
-
-    # Bluetooth Connection Quality
-    client.async_get_bt_connection_quality = AsyncMock(return_value="prioritysound")
-    client.async_set_bt_connection_quality = AsyncMock(return_value=True)
-
-    # External Control
-    client.async_get_external_control = AsyncMock(return_value="on")
-    client.async_set_external_control = AsyncMock(return_value=True)
-
-    # HDMI Standby Link
-    client.async_get_hdmi_standby_link = AsyncMock(return_value="auto")
-    client.async_set_hdmi_standby_link = AsyncMock(return_value=True)
-
-    # Net/BT Standby
-    client.async_get_net_bt_standby = AsyncMock(return_value="off")
-    client.async_set_net_bt_standby = AsyncMock(return_value=True)
-
-    # Voice Zoom
-    client.async_get_voice_zoom = AsyncMock(return_value="off")
-    client.async_set_voice_zoom = AsyncMock(return_value=True)
-    client.voice_zoom = "off"
-
-    # Audio Return Channel
-    client.async_get_audio_return_channel = AsyncMock(return_value="arc")
-    client.async_set_audio_return_channel = AsyncMock(return_value=True)
-
-    # Voice Zoom Level (read-only)
-    client.async_get_voice_zoom_level = AsyncMock(return_value=1)
-
-    # Diagnostic sensors (read-only)
-    client.async_get_timezone = AsyncMock(return_value="America/New_York|-300")
-    client.async_get_temperature = AsyncMock(return_value="F:134,C:57")
-    client.async_get_360ssm = AsyncMock(return_value="on")
-    client.async_get_network_mode = AsyncMock(return_value="wired")
-    client.async_get_ip_address = AsyncMock(return_value="192.168.1.100")
-    client.async_get_device_name = AsyncMock(return_value="Test BRAVIA Theatre Quad")
-    client.async_get_destination = AsyncMock(return_value="us")
-    client.async_get_language = AsyncMock(return_value="english")
-    client.async_get_dhcp = AsyncMock(return_value="on")
+@pytest.fixture(scope="session")
+def bravia_quad_client_class() -> MagicMock:
+    """Return an autospec of BraviaQuadClient, built once per session."""
+    return create_autospec(BraviaQuadClient)
 
 
 @pytest.fixture
-def mock_bravia_quad_client() -> Generator[MagicMock]:
+def mock_bravia_quad_client(
+    bravia_quad_client_class: MagicMock,
+) -> Generator[MagicMock]:
     """Return a mocked BraviaQuadClient."""
+    client_mock = bravia_quad_client_class
     with (
-        patch(
-            "custom_components.bravia_quad.BraviaQuadClient",
-            autospec=True,
-        ) as client_mock,
-        patch(
-            "custom_components.bravia_quad.config_flow.BraviaQuadClient",
-            new=client_mock,
-        ),
+        patch.object(bravia_quad, "BraviaQuadClient", new=client_mock),
+        patch.object(config_flow, "BraviaQuadClient", new=client_mock),
     ):
+        # The spec tree is shared across tests; drop state left by the last one
+        client_mock.reset_mock()
         client = client_mock.return_value
+        client.reset_mock(return_value=True, side_effect=True)
 
         # Setup async methods
         client.async_connect = AsyncMock()
@@ -304,12 +246,12 @@ def mock_bravia_quad_client() -> Generator[MagicMock]:
         client.async_send_command = AsyncMock(return_value={"value": "ACK"})
 
         # Notification callbacks
-        client.register_notification_callback = MagicMock()
-        client.unregister_notification_callback = MagicMock()
+        client.register_notification_callback = Mock()
+        client.unregister_notification_callback = Mock()
 
         # Availability
-        client.register_availability_callback = MagicMock()
-        client.unregister_availability_callback = MagicMock()
+        client.register_availability_callback = Mock()
+        client.unregister_availability_callback = Mock()
         client.is_connected = True
 
         yield client
@@ -390,27 +332,27 @@ async def _setup_integration_with_suffixes_enabled(
     """Set up the integration and enable disabled entities matching suffixes."""
     mock_config_entry.add_to_hass(hass)
 
+    # One patch spans both the initial setup and the enabling reload
     with patch("custom_components.bravia_quad.PLATFORMS", platforms):
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
 
-    entity_registry = er.async_get(hass)
-    entities_to_enable = []
-    for suffix in suffixes:
-        entity_id = get_entity_id_by_unique_id_suffix(entity_registry, suffix)
-        if entity_id is None:
-            continue
-        entry = entity_registry.async_get(entity_id)
-        if entry and entry.disabled_by is not None:
-            entities_to_enable.append(entity_id)
-
-    if entities_to_enable:
-        for entity_id in entities_to_enable:
-            entity_registry.async_update_entity(entity_id, disabled_by=None)
-        with patch("custom_components.bravia_quad.PLATFORMS", platforms):
+        entity_registry = er.async_get(hass)
+        entities_to_enable = []
+        for suffix in suffixes:
+            entity_id = get_entity_id_by_unique_id_suffix(entity_registry, suffix)
+            if entity_id is None:
+                continue
+            entry = entity_registry.async_get(entity_id)
+            if entry and entry.disabled_by is not None:
+                entities_to_enable.append(entity_id)
+
+        if entities_to_enable:
+            for entity_id in entities_to_enable:
+                entity_registry.async_update_entity(entity_id, disabled_by=None)
             await hass.config_entries.async_reload(mock_config_entry.entry_id)
             await hass.async_block_till_done()
-        await _await_entity_states(hass, entities_to_enable)
+            await _await_entity_states(hass, entities_to_enable)
 
     return mock_config_entry
 
@@ -433,6 +375,24 @@ async def init_integration(
     return mock_config_entry
 
 
+@pytest.fixture
+async def init_integration_no_subwoofer(
+    hass: HomeAssistant,
+    mock_config_entry_no_subwoofer: MockConfigEntry,
+    mock_bravia_quad_client: MagicMock,
+    mock_bravia_http_client: MagicMock,
+    platforms: list[Platform],
+) -> MockConfigEntry:
+    """Set up the Bravia Quad integration for a setup without a subwoofer."""
+    mock_config_entry_no_subwoofer.add_to_hass(hass)
+
+    with patch("custom_components.bravia_quad.PLATFORMS", platforms):
+        await hass.config_entries.async_setup(mock_config_entry_no_subwoofer.entry_id)
+        await hass.async_block_till_done()
+
+    return mock_config_entry_no_subwoofer
+
+
 @pytest.fixture
 async def init_integration_volume(
     hass: HomeAssistant,
@@ -456,31 +416,17 @@ async def init_integration_all(
     mock_config_entry: MockConfigEntry,
     mock_bravia_quad_client: MagicMock,
     mock_bravia_http_client: MagicMock,
+    entity_registry_enabled_by_default: None,
     platforms: list[Platform],
 ) -> MockConfigEntry:
     """Set up the Bravia Quad integration with all entities enabled."""
     mock_config_entry.add_to_hass(hass)
 
+    # Entities register enabled up front, so no enabling reload is needed
     with patch("custom_components.bravia_quad.PLATFORMS", platforms):
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
 
-    # Enable all disabled entities
-    entity_registry = er.async_get(hass)
-    entities_to_enable = [
-        entry.entity_id
-        for entry in entity_registry.entities.values()
-        if entry.disabled_by is not None
-    ]
-
-    if entities_to_enable:
-        for entity_id in entities_to_enable:
-            entity_registry.async_update_entity(entity_id, disabled_by=None)
-        with patch("custom_components.bravia_quad.PLATFORMS", platforms):
-            await hass.config_entries.async_reload(mock_config_entry.entry_id)
-            await hass.async_block_till_done()
-        await _await_entity_states(hass, entities_to_enable)
-
     return mock_config_entry
 
 
@@ -494,10 +440,10 @@ def grpc_client() -> MagicMock:
     client.capability_index = None
     client.volume_step_interval = 0
     client.async_exec_command = AsyncMock(return_value=True)
-    client.add_state_callback = MagicMock()
-    client.remove_state_callback = MagicMock()
-    client.register_availability_callback = MagicMock()
-    client.unregister_availability_callback = MagicMock()
+    client.add_state_callback = Mock()
+    client.remove_state_callback = Mock()
+    client.register_availability_callback = Mock()
+    client.unregister_availability_callback = Mock()
     return client
 
 
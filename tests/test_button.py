@@ -6,7 +6,6 @@ from typing import TYPE_CHECKING
 
 import pytest
 from homeassistant.const import ATTR_ENTITY_ID, Platform
-from homeassistant.helpers import entity_registry as er
 
 from .conftest import get_entity_id_by_unique_id_suffix
 
@@ -14,6 +13,7 @@ if TYPE_CHECKING:
     from unittest.mock import MagicMock
 
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers import entity_registry as er
 
 BUTTON_DOMAIN = "button"
 
@@ -51,10 +51,6 @@ async def test_detect_subwoofer_button_press(
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_detect_subwoofer")
     assert entity_id is not None
 
-    # Verify entity exists
-    state = hass.states.get(entity_id)
-    assert state is not None
-
     mock_bravia_quad_client.async_detect_subwoofer.return_value = True
 
     await hass.services.async_call(
@@ -77,10 +73,6 @@ async def test_bluetooth_pairing_button_press(
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_bluetooth_pairing")
     assert entity_id is not None
 
-    # Verify entity exists
-    state = hass.states.get(entity_id)
-    assert state is not None
-
     await hass.services.async_call(
         BUTTON_DOMAIN,
         "press",
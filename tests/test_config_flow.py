@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
 from ipaddress import ip_address as make_ip_address
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, patch
 
+import pytest
 from homeassistant.config_entries import SOURCE_USER, SOURCE_ZEROCONF
 from homeassistant.const import CONF_HOST, CONF_MAC, CONF_NAME
 from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers.device_registry import format_mac
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -31,12 +32,14 @@ from custom_components.bravia_quad.const import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Mapping
+    from unittest.mock import MagicMock
 
     from homeassistant.core import HomeAssistant
 
 TEST_HOST = "192.168.1.100"
-TEST_MAC_FORMATTED = "60:ff:9e:12:34:56"
+TEST_MAC_RAW = "60:FF:9E:12:34:56"  # As advertised in the zeroconf deviceid
+TEST_MAC_FORMATTED = format_mac(TEST_MAC_RAW)
 TEST_MODEL = "Bravia Theatre Quad"
 TEST_SERIAL = "1234567"
 TEST_MODEL_ID = "HT-A9M2"
@@ -54,31 +57,54 @@ def _setup_client_identity(client: AsyncMock) -> None:
     client.async_get_device_name = AsyncMock(return_value=TEST_DEVICE_NAME)
 
 
-def _setup_tcp_client(client: AsyncMock, *, has_subwoofer: bool = True) -> None:
-    """Configure a TCP client mock for validate_input."""
-    client.async_connect = AsyncMock()
-    client.async_disconnect = AsyncMock()
-    client.async_test_connection = AsyncMock(return_value=True)
-    client.async_detect_subwoofer = AsyncMock(return_value=has_subwoofer)
-    _setup_client_identity(client)
-
-
-@contextmanager
-def _patch_tcp_client(
-    *,
-    has_subwoofer: bool = True,
-    **client_overrides: Any,
-) -> Generator[AsyncMock]:
-    """Patch BraviaQuadClient in config flow with a configured mock."""
-    with patch(
-        "custom_components.bravia_quad.config_flow.BraviaQuadClient",
-        autospec=True,
-    ) as client_mock:
-        client = client_mock.return_value
-        _setup_tcp_client(client, has_subwoofer=has_subwoofer)
-        for name, value in client_overrides.items():
-            setattr(client, name, value)
-        yield client
+@pytest.fixture
+def add_existing_entry(hass: HomeAssistant) -> Callable[..., MockConfigEntry]:
+    """Return a factory that adds an already configured entry to hass."""
+
+    def _add(
+        unique_id: str,
+        *,
+        host: str = TEST_HOST,
+        data: Mapping[str, Any] | None = None,
+        title: str = "Bravia Quad",
+    ) -> MockConfigEntry:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=title,
+            data={CONF_HOST: host, CONF_HAS_SUBWOOFER: True, **(data or {})},
+            unique_id=unique_id,
+        )
+        entry.add_to_hass(hass)
+        return entry
+
+    return _add
+
+
+@pytest.fixture
+async def user_flow_id(hass: HomeAssistant) -> str:
+    """Start a user flow and return its id."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_USER}
+    )
+    assert result["type"] is FlowResultType.FORM
+    return result["flow_id"]
+
+
+@pytest.fixture
+async def zeroconf_flow_id(hass: HomeAssistant) -> str:
+    """Start a zeroconf flow for the test device and return its id."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_ZEROCONF}, data=ZEROCONF_QUAD
+    )
+    assert result["step_id"] == "zeroconf_confirm"
+    return result["flow_id"]
+
+
+@pytest.fixture
+def tcp_client(mock_bravia_quad_client: MagicMock) -> MagicMock:
+    """Return the patched config flow client with the test device identity."""
+    _setup_client_identity(mock_bravia_quad_client)
+    return mock_bravia_quad_client
 
 
 async def _enter_host(hass: HomeAssistant, flow_id: str) -> dict:
@@ -121,13 +147,18 @@ async def _submit_grpc_oauth_redirect(
 
 
 async def _confirm_setup(hass: HomeAssistant, flow_id: str) -> dict:
-    """Confirm setup in the user_confirm step."""
-    result = await hass.config_entries.flow.async_configure(flow_id, user_input={})
-    await hass.async_block_till_done()
-    return result
+    """
+    Confirm setup in the user_confirm step.
+
+    Callers patch async_setup_entry, and the entry is set up before
+    async_configure returns, so there is nothing left to drain.
+    """
+    return await hass.config_entries.flow.async_configure(flow_id, user_input={})
 
 
-async def test_user_flow_success(hass: HomeAssistant, mock_setup_entry: None) -> None:
+async def test_user_flow_success(
+    hass: HomeAssistant, mock_setup_entry: AsyncMock, tcp_client: MagicMock
+) -> None:
     """Test successful user flow with confirmation step."""
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": SOURCE_USER}
@@ -139,14 +170,12 @@ async def test_user_flow_success(hass: HomeAssistant, mock_setup_entry: None) ->
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "transport"
 
-    with _patch_tcp_client():
-        result = await _select_tcp_transport(hass, result["flow_id"])
+    result = await _select_tcp_transport(hass, result["flow_id"])
 
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "user_confirm"
 
-    with _patch_tcp_client():
-        result = await _confirm_setup(hass, result["flow_id"])
+    result = await _confirm_setup(hass, result["flow_id"])
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == TEST_DEVICE_NAME
@@ -162,92 +191,72 @@ async def test_user_flow_success(hass: HomeAssistant, mock_setup_entry: None) ->
         CONF_TRANSPORT: TRANSPORT_TCP,
     }
     assert result["result"].unique_id == TEST_SERIAL
+    assert len(mock_setup_entry.mock_calls) == 1
 
 
 async def test_user_flow_success_no_subwoofer(
-    hass: HomeAssistant, mock_setup_entry: None
+    hass: HomeAssistant,
+    mock_setup_entry: AsyncMock,
+    tcp_client: MagicMock,
+    user_flow_id: str,
 ) -> None:
     """Test successful user flow without subwoofer."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
-
-    result = await _enter_host(hass, result["flow_id"])
+    result = await _enter_host(hass, user_flow_id)
     assert result["step_id"] == "transport"
 
-    with _patch_tcp_client(has_subwoofer=False):
-        result = await _select_tcp_transport(hass, result["flow_id"])
+    tcp_client.async_detect_subwoofer.return_value = False
+    result = await _select_tcp_transport(hass, result["flow_id"])
 
     assert result["step_id"] == "user_confirm"
 
-    with _patch_tcp_client(has_subwoofer=False):
-        result = await _confirm_setup(hass, result["flow_id"])
+    result = await _confirm_setup(hass, result["flow_id"])
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["data"][CONF_HAS_SUBWOOFER] is False
 
 
-async def test_user_flow_connection_error(hass: HomeAssistant) -> None:
-    """Test user flow when connection fails on transport step."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
-
-    result = await _enter_host(hass, result["flow_id"])
-    assert result["step_id"] == "transport"
-
-    with _patch_tcp_client(
-        async_connect=AsyncMock(side_effect=OSError("Connection refused"))
-    ):
-        result = await _select_tcp_transport(hass, result["flow_id"])
-
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "transport"
-    assert result["errors"] == {"base": "cannot_connect"}
-
-
-async def test_user_flow_test_connection_fails(hass: HomeAssistant) -> None:
-    """Test user flow when test connection returns False."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
-
-    result = await _enter_host(hass, result["flow_id"])
-
-    with _patch_tcp_client(async_test_connection=AsyncMock(return_value=False)):
-        result = await _select_tcp_transport(hass, result["flow_id"])
-
-    assert result["type"] is FlowResultType.FORM
+@pytest.mark.parametrize(
+    ("method", "attr", "value", "error"),
+    [
+        ("async_connect", "side_effect", OSError("Refused"), "cannot_connect"),
+        ("async_test_connection", "return_value", False, "cannot_connect"),
+        ("async_connect", "side_effect", TimeoutError("Timeout"), "cannot_connect"),
+        ("async_test_connection", "side_effect", RuntimeError("Unexpected"), "unknown"),
+    ],
+    ids=["connection_error", "test_connection_fails", "timeout", "unknown_error"],
+)
+async def test_user_flow_error(
+    hass: HomeAssistant,
+    tcp_client: MagicMock,
+    method: str,
+    attr: str,
+    value: object,
+    error: str,
+    user_flow_id: str,
+) -> None:
+    """Test user flow shows an error on the transport step when validation fails."""
+    result = await _enter_host(hass, user_flow_id)
     assert result["step_id"] == "transport"
-    assert result["errors"] == {"base": "cannot_connect"}
-
-
-async def test_user_flow_timeout_error(hass: HomeAssistant) -> None:
-    """Test user flow when connection times out."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
 
-    result = await _enter_host(hass, result["flow_id"])
-
-    with _patch_tcp_client(
-        async_connect=AsyncMock(side_effect=TimeoutError("Connection timeout"))
-    ):
-        result = await _select_tcp_transport(hass, result["flow_id"])
+    setattr(getattr(tcp_client, method), attr, value)
+    result = await _select_tcp_transport(hass, result["flow_id"])
 
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "transport"
-    assert result["errors"] == {"base": "cannot_connect"}
+    assert result["errors"] == {"base": error}
 
 
-async def test_user_flow_duplicate_entry(hass: HomeAssistant) -> None:
+async def test_user_flow_duplicate_entry(
+    hass: HomeAssistant,
+    tcp_client: MagicMock,
+    user_flow_id: str,
+    add_existing_entry: Callable[..., MockConfigEntry],
+) -> None:
     """Test user flow when entry already exists."""
-    existing_entry = MockConfigEntry(
+    add_existing_entry(
+        TEST_SERIAL,
         title=TEST_DEVICE_NAME,
-        domain=DOMAIN,
         data={
-            CONF_HOST: TEST_HOST,
-            CONF_HAS_SUBWOOFER: True,
             CONF_SERIAL: TEST_SERIAL,
             CONF_MODEL_ID: TEST_MODEL_ID,
             CONF_MODEL: MODEL_ID_TO_NAME[TEST_MODEL_ID],
@@ -256,50 +265,26 @@ async def test_user_flow_duplicate_entry(hass: HomeAssistant) -> None:
             CONF_NAME: TEST_DEVICE_NAME,
             CONF_TRANSPORT: TRANSPORT_TCP,
         },
-        unique_id=TEST_SERIAL,
     )
-    existing_entry.add_to_hass(hass)
 
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
+    result = await _enter_host(hass, user_flow_id)
 
-    result = await _enter_host(hass, result["flow_id"])
-
-    with _patch_tcp_client():
-        result = await _select_tcp_transport(hass, result["flow_id"])
+    result = await _select_tcp_transport(hass, result["flow_id"])
 
     assert result["step_id"] == "user_confirm"
 
-    with _patch_tcp_client():
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"], user_input={}
-        )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={}
+    )
 
     assert result["type"] is FlowResultType.ABORT
     assert result["reason"] == "already_configured"
 
 
-async def test_user_flow_unknown_error(hass: HomeAssistant) -> None:
-    """Test user flow when an unknown error occurs."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
-
-    result = await _enter_host(hass, result["flow_id"])
-
-    with _patch_tcp_client(
-        async_test_connection=AsyncMock(side_effect=RuntimeError("Unexpected"))
-    ):
-        result = await _select_tcp_transport(hass, result["flow_id"])
-
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "transport"
-    assert result["errors"] == {"base": "unknown"}
-
-
 async def test_user_flow_grpc_success(
-    hass: HomeAssistant, mock_setup_entry: None
+    hass: HomeAssistant,
+    mock_setup_entry: AsyncMock,
+    user_flow_id: str,
 ) -> None:
     """Test successful gRPC transport setup."""
     grpc_setup = {
@@ -314,10 +299,7 @@ async def test_user_flow_grpc_success(
         CONF_GRPC_KEYS: TEST_GRPC_KEYS,
     }
 
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_USER}
-    )
-    result = await _enter_host(hass, result["flow_id"])
+    result = await _enter_host(hass, user_flow_id)
 
     with patch.object(
         BraviaQuadConfigFlow,
@@ -344,9 +326,10 @@ def _zeroconf_discovery_info(
     host: str = TEST_HOST, **properties: str
 ) -> ZeroconfServiceInfo:
     """Build zeroconf discovery info for tests."""
+    ip = make_ip_address(host)
     return ZeroconfServiceInfo(
-        ip_address=make_ip_address(host),
-        ip_addresses=[make_ip_address(host)],
+        ip_address=ip,
+        ip_addresses=[ip],
         port=7000,
         hostname="bravia-quad.local",
         type="_airplay._tcp.local.",
@@ -355,13 +338,29 @@ def _zeroconf_discovery_info(
     )
 
 
-async def test_zeroconf_discovery(hass: HomeAssistant, mock_setup_entry: None) -> None:
+# Built once; the config flow only reads discovery info
+ZEROCONF_QUAD = _zeroconf_discovery_info(
+    model="Bravia Theatre Quad",
+    deviceid=TEST_MAC_RAW,
+)
+ZEROCONF_QUAD_WITH_MANUFACTURER = _zeroconf_discovery_info(
+    model="Bravia Theatre Quad",
+    deviceid=TEST_MAC_RAW,
+    manufacturer="Sony Corporation",
+)
+ZEROCONF_QUAD_NO_DEVICEID = _zeroconf_discovery_info(model="Bravia Theatre Quad")
+ZEROCONF_OTHER_DEVICE = _zeroconf_discovery_info(
+    host="192.168.1.200",
+    model="Bravia Theatre A8",
+    deviceid="AA:BB:CC:DD:EE:FF",
+)
+
+
+async def test_zeroconf_discovery(
+    hass: HomeAssistant, mock_setup_entry: AsyncMock, tcp_client: MagicMock
+) -> None:
     """Test zeroconf discovery creates entry with serial-based unique_id."""
-    discovery_info = _zeroconf_discovery_info(
-        model="Bravia Theatre Quad",
-        deviceid="60:FF:9E:12:34:56",
-        manufacturer="Sony Corporation",
-    )
+    discovery_info = ZEROCONF_QUAD_WITH_MANUFACTURER
 
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": SOURCE_ZEROCONF}, data=discovery_info
@@ -373,13 +372,11 @@ async def test_zeroconf_discovery(hass: HomeAssistant, mock_setup_entry: None) -
     )
     assert result["step_id"] == "transport"
 
-    with _patch_tcp_client():
-        result = await _select_tcp_transport(hass, result["flow_id"])
+    result = await _select_tcp_transport(hass, result["flow_id"])
 
     assert result["step_id"] == "user_confirm"
 
-    with _patch_tcp_client():
-        result = await _confirm_setup(hass, result["flow_id"])
+    result = await _confirm_setup(hass, result["flow_id"])
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["data"][CONF_HOST] == TEST_HOST
@@ -391,13 +388,16 @@ async def test_zeroconf_discovery(hass: HomeAssistant, mock_setup_entry: None) -
     assert result["data"][CONF_NAME] == TEST_DEVICE_NAME
     assert result["data"][CONF_TRANSPORT] == TRANSPORT_TCP
     assert result["result"].unique_id == TEST_SERIAL
+    assert len(mock_setup_entry.mock_calls) == 1
 
 
 async def test_zeroconf_discovery_without_deviceid(
-    hass: HomeAssistant, mock_setup_entry: None
+    hass: HomeAssistant,
+    mock_setup_entry: AsyncMock,
+    tcp_client: MagicMock,
 ) -> None:
     """Test zeroconf discovery uses serial unique_id when deviceid is missing."""
-    discovery_info = _zeroconf_discovery_info(model="Bravia Theatre Quad")
+    discovery_info = ZEROCONF_QUAD_NO_DEVICEID
 
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": SOURCE_ZEROCONF}, data=discovery_info
@@ -408,11 +408,9 @@ async def test_zeroconf_discovery_without_deviceid(
         result["flow_id"], user_input={}
     )
 
-    with _patch_tcp_client():
-        result = await _select_tcp_transport(hass, result["flow_id"])
+    result = await _select_tcp_transport(hass, result["flow_id"])
 
-    with _patch_tcp_client():
-        result = await _confirm_setup(hass, result["flow_id"])
+    result = await _confirm_setup(hass, result["flow_id"])
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["data"][CONF_MAC] == TEST_MAC_FORMATTED
@@ -420,58 +418,31 @@ async def test_zeroconf_discovery_without_deviceid(
     assert result["result"].unique_id == TEST_SERIAL
 
 
-async def test_zeroconf_discovery_migrates_existing_ip_entry(
-    hass: HomeAssistant,
-) -> None:
-    """Test zeroconf discovery migrates existing IP-based entry to MAC-based."""
-    existing_entry = MockConfigEntry(
-        domain=DOMAIN,
-        title="Bravia Quad",
-        data={
-            CONF_HOST: TEST_HOST,
-            CONF_HAS_SUBWOOFER: True,
-        },
-        unique_id=TEST_HOST,
-    )
-    existing_entry.add_to_hass(hass)
-
-    discovery_info = _zeroconf_discovery_info(
-        model="Bravia Theatre Quad",
-        deviceid="60:FF:9E:12:34:56",
-    )
-
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_ZEROCONF}, data=discovery_info
-    )
-
-    assert result["type"] is FlowResultType.ABORT
-    assert result["reason"] == "already_configured"
-    assert existing_entry.data[CONF_HOST] == TEST_HOST
-
-
-async def test_zeroconf_discovery_already_configured_by_mac(
+@pytest.mark.parametrize(
+    ("unique_id", "host", "data"),
+    [
+        (TEST_HOST, TEST_HOST, {}),
+        (TEST_MAC_FORMATTED, "192.168.1.50", {CONF_MAC: TEST_MAC_FORMATTED}),
+        (
+            TEST_SERIAL,
+            "192.168.1.50",
+            {CONF_MAC: TEST_MAC_FORMATTED, CONF_SERIAL: TEST_SERIAL},
+        ),
+    ],
+    ids=["ip_entry", "mac_entry", "serial_entry_by_mac"],
+)
+async def test_zeroconf_rediscovery_updates_existing_entry(
     hass: HomeAssistant,
+    add_existing_entry: Callable[..., MockConfigEntry],
+    unique_id: str,
+    host: str,
+    data: dict[str, str],
 ) -> None:
-    """Test zeroconf discovery updates host when already configured by MAC."""
-    existing_entry = MockConfigEntry(
-        domain=DOMAIN,
-        title="Bravia Quad",
-        data={
-            CONF_HOST: "192.168.1.50",
-            CONF_MAC: TEST_MAC_FORMATTED,
-            CONF_HAS_SUBWOOFER: True,
-        },
-        unique_id=TEST_MAC_FORMATTED,
-    )
-    existing_entry.add_to_hass(hass)
-
-    discovery_info = _zeroconf_discovery_info(
-        model="Bravia Theatre Quad",
-        deviceid="60:FF:9E:12:34:56",
-    )
+    """Test rediscovery of a configured device aborts and updates its host."""
+    existing_entry = add_existing_entry(unique_id, host=host, data=data)
 
     result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_ZEROCONF}, data=discovery_info
+        DOMAIN, context={"source": SOURCE_ZEROCONF}, data=ZEROCONF_QUAD
     )
 
     assert result["type"] is FlowResultType.ABORT
@@ -481,26 +452,14 @@ async def test_zeroconf_discovery_already_configured_by_mac(
 
 async def test_zeroconf_second_device_not_aborted_when_serial_entry_exists(
     hass: HomeAssistant,
+    add_existing_entry: Callable[..., MockConfigEntry],
 ) -> None:
     """Test a second Theatre is not treated as the first serial-based entry."""
-    existing_entry = MockConfigEntry(
-        domain=DOMAIN,
-        title="Bravia Quad",
-        data={
-            CONF_HOST: TEST_HOST,
-            CONF_MAC: TEST_MAC_FORMATTED,
-            CONF_SERIAL: TEST_SERIAL,
-            CONF_HAS_SUBWOOFER: True,
-        },
-        unique_id=TEST_SERIAL,
+    existing_entry = add_existing_entry(
+        TEST_SERIAL, data={CONF_MAC: TEST_MAC_FORMATTED, CONF_SERIAL: TEST_SERIAL}
     )
-    existing_entry.add_to_hass(hass)
 
-    discovery_info = _zeroconf_discovery_info(
-        host="192.168.1.200",
-        model="Bravia Theatre A8",
-        deviceid="AA:BB:CC:DD:EE:FF",
-    )
+    discovery_info = ZEROCONF_OTHER_DEVICE
 
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": SOURCE_ZEROCONF}, data=discovery_info
@@ -511,92 +470,41 @@ async def test_zeroconf_second_device_not_aborted_when_serial_entry_exists(
     assert existing_entry.data[CONF_HOST] == TEST_HOST
 
 
-async def test_zeroconf_rediscovery_matches_serial_entry_by_mac(
+@pytest.mark.parametrize(
+    ("method", "exception", "error"),
+    [
+        ("async_connect", OSError("Connection refused"), "cannot_connect"),
+        ("async_test_connection", RuntimeError("Unexpected"), "unknown"),
+    ],
+    ids=["connection_error", "unknown_error"],
+)
+async def test_zeroconf_confirm_error(
     hass: HomeAssistant,
+    tcp_client: MagicMock,
+    zeroconf_flow_id: str,
+    method: str,
+    exception: Exception,
+    error: str,
 ) -> None:
-    """Test rediscovery updates host for a serial unique_id entry matched by MAC."""
-    existing_entry = MockConfigEntry(
-        domain=DOMAIN,
-        title="Bravia Quad",
-        data={
-            CONF_HOST: "192.168.1.50",
-            CONF_MAC: TEST_MAC_FORMATTED,
-            CONF_SERIAL: TEST_SERIAL,
-            CONF_HAS_SUBWOOFER: True,
-        },
-        unique_id=TEST_SERIAL,
-    )
-    existing_entry.add_to_hass(hass)
-
-    discovery_info = _zeroconf_discovery_info(
-        model="Bravia Theatre Quad",
-        deviceid="60:FF:9E:12:34:56",
-    )
-
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_ZEROCONF}, data=discovery_info
-    )
-
-    assert result["type"] is FlowResultType.ABORT
-    assert result["reason"] == "already_configured"
-    assert existing_entry.data[CONF_HOST] == TEST_HOST
-
-
-async def test_zeroconf_confirm_connection_error(hass: HomeAssistant) -> None:
-    """Test zeroconf flow handles connection errors on transport step."""
-    discovery_info = _zeroconf_discovery_info(
-        model="Bravia Theatre Quad",
-        deviceid="60:FF:9E:12:34:56",
-    )
-
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_ZEROCONF}, data=discovery_info
-    )
-
+    """Test zeroconf flow shows validation errors on the transport step."""
     result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], user_input={}
+        zeroconf_flow_id, user_input={}
     )
     assert result["step_id"] == "transport"
 
-    with _patch_tcp_client(
-        async_connect=AsyncMock(side_effect=OSError("Connection refused"))
-    ):
-        result = await _select_tcp_transport(hass, result["flow_id"])
-
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "transport"
-    assert result["errors"] == {"base": "cannot_connect"}
-
-
-async def test_zeroconf_confirm_unknown_error(hass: HomeAssistant) -> None:
-    """Test zeroconf flow handles unknown errors on transport step."""
-    discovery_info = _zeroconf_discovery_info(
-        model="Bravia Theatre Quad",
-        deviceid="60:FF:9E:12:34:56",
-    )
-
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": SOURCE_ZEROCONF}, data=discovery_info
-    )
-
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], user_input={}
-    )
-
-    with _patch_tcp_client(
-        async_test_connection=AsyncMock(side_effect=RuntimeError("Unexpected"))
-    ):
-        result = await _select_tcp_transport(hass, result["flow_id"])
+    getattr(tcp_client, method).side_effect = exception
+    result = await _select_tcp_transport(hass, result["flow_id"])
 
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "transport"
-    assert result["errors"] == {"base": "unknown"}
+    assert result["errors"] == {"base": error}
 
 
 async def test_reauth_flow_success(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
-    mock_setup_entry: None,
+    mock_setup_entry: AsyncMock,
+    tcp_client: MagicMock,
 ) -> None:
     """Test successful reauth flow updates host."""
     mock_config_entry.add_to_hass(hass)
@@ -606,79 +514,60 @@ async def test_reauth_flow_success(
 
     new_host = "192.168.1.200"
 
-    with _patch_tcp_client():
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            user_input={CONF_HOST: new_host},
-        )
-        await hass.async_block_till_done()
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={CONF_HOST: new_host},
+    )
+    await hass.async_block_till_done()
 
     assert result["type"] is FlowResultType.ABORT
     assert result["reason"] == "reauth_successful"
     assert mock_config_entry.data[CONF_HOST] == new_host
 
 
-async def test_reauth_flow_connection_error(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-) -> None:
-    """Test reauth flow handles connection errors."""
-    mock_config_entry.add_to_hass(hass)
-
-    result = await mock_config_entry.start_reauth_flow(hass)
-
-    with _patch_tcp_client(
-        async_connect=AsyncMock(side_effect=OSError("Connection refused"))
-    ):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            user_input={CONF_HOST: "192.168.1.200"},
-        )
-
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "reauth_confirm"
-    assert result["errors"] == {"base": "cannot_connect"}
-
-
-async def test_reauth_flow_unknown_error(
+@pytest.mark.parametrize(
+    ("method", "exception", "error"),
+    [
+        ("async_connect", OSError("Connection refused"), "cannot_connect"),
+        ("async_test_connection", RuntimeError("Unexpected"), "unknown"),
+    ],
+    ids=["connection_error", "unknown_error"],
+)
+async def test_reauth_flow_error(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
+    tcp_client: MagicMock,
+    method: str,
+    exception: Exception,
+    error: str,
 ) -> None:
-    """Test reauth flow handles unknown errors."""
+    """Test reauth flow shows validation errors on the confirm step."""
     mock_config_entry.add_to_hass(hass)
 
     result = await mock_config_entry.start_reauth_flow(hass)
 
-    with _patch_tcp_client(
-        async_test_connection=AsyncMock(side_effect=RuntimeError("Unexpected"))
-    ):
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            user_input={CONF_HOST: "192.168.1.200"},
-        )
+    getattr(tcp_client, method).side_effect = exception
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={CONF_HOST: "192.168.1.200"},
+    )
 
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "reauth_confirm"
-    assert result["errors"] == {"base": "unknown"}
+    assert result["errors"] == {"base": error}
 
 
 async def test_reauth_flow_grpc_updates_keys(
     hass: HomeAssistant,
-    mock_setup_entry: None,
+    mock_setup_entry: AsyncMock,
+    add_existing_entry: Callable[..., MockConfigEntry],
 ) -> None:
     """Test gRPC reauth runs Sony OAuth and updates stored credentials."""
-    entry = MockConfigEntry(
+    entry = add_existing_entry(
+        TEST_SERIAL,
         title=TEST_DEVICE_NAME,
-        domain=DOMAIN,
-        data={
-            CONF_HOST: TEST_HOST,
-            CONF_TRANSPORT: TRANSPORT_GRPC,
-            CONF_GRPC_KEYS: TEST_GRPC_KEYS,
-            CONF_HAS_SUBWOOFER: True,
-        },
-        unique_id=TEST_SERIAL,
+        data={CONF_TRANSPORT: TRANSPORT_GRPC, CONF_GRPC_KEYS: TEST_GRPC_KEYS},
     )
-    entry.add_to_hass(hass)
 
     new_host = "192.168.1.200"
     new_keys = '{"device_id": "dev", "refresh_token": "rt"}'
@@ -713,21 +602,16 @@ async def test_reauth_flow_grpc_updates_keys(
 
 
 async def test_options_flow_grpc_debug(
-    hass: HomeAssistant, mock_setup_entry: None
+    hass: HomeAssistant,
+    mock_setup_entry: AsyncMock,
+    add_existing_entry: Callable[..., MockConfigEntry],
 ) -> None:
     """Test gRPC transport options flow stores debug flag."""
-    entry = MockConfigEntry(
+    entry = add_existing_entry(
+        TEST_SERIAL,
         title=TEST_DEVICE_NAME,
-        domain=DOMAIN,
-        data={
-            CONF_HOST: TEST_HOST,
-            CONF_TRANSPORT: TRANSPORT_GRPC,
-            CONF_GRPC_KEYS: TEST_GRPC_KEYS,
-            CONF_HAS_SUBWOOFER: True,
-        },
-        unique_id=TEST_SERIAL,
+        data={CONF_TRANSPORT: TRANSPORT_GRPC, CONF_GRPC_KEYS: TEST_GRPC_KEYS},
     )
-    entry.add_to_hass(hass)
 
     result = await hass.config_entries.options.async_init(entry.entry_id)
     assert result["step_id"] == "init"
@@ -741,19 +625,15 @@ async def test_options_flow_grpc_debug(
     assert entry.options[CONF_GRPC_DEBUG] is True
 
 
-async def test_options_flow_tcp_aborts(hass: HomeAssistant) -> None:
+async def test_options_flow_tcp_aborts(
+    hass: HomeAssistant, add_existing_entry: Callable[..., MockConfigEntry]
+) -> None:
     """Test TCP transport entries cannot open gRPC options."""
-    entry = MockConfigEntry(
+    entry = add_existing_entry(
+        TEST_HOST,
         title=TEST_DEVICE_NAME,
-        domain=DOMAIN,
-        data={
-            CONF_HOST: TEST_HOST,
-            CONF_TRANSPORT: TRANSPORT_TCP,
-            CONF_HAS_SUBWOOFER: True,
-        },
-        unique_id=TEST_HOST,
+        data={CONF_TRANSPORT: TRANSPORT_TCP},
     )
-    entry.add_to_hass(hass)
 
     result = await hass.config_entries.options.async_init(entry.entry_id)
 
@@ -33,6 +33,14 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
 
+LEGACY_ENTRY_ID = "old_entry_id"
+LEGACY_UNIQUE_ID = "192.168.1.100"
+LEGACY_IDENTIFIERS = frozenset({(DOMAIN, LEGACY_ENTRY_ID)})
+MIGRATED_IDENTIFIERS = frozenset({(DOMAIN, LEGACY_UNIQUE_ID)})
+LEGACY_PREFIX = f"{DOMAIN}_{LEGACY_ENTRY_ID}_"
+MIGRATED_PREFIX = f"{LEGACY_UNIQUE_ID}_"
+
+
 # =============================================================================
 # Device registry enrichment tests
 # =============================================================================
@@ -292,6 +300,20 @@ def test_get_device_info_without_unique_id_raises() -> None:
 # =============================================================================
 
 
+@pytest.fixture
+def legacy_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return an entry whose entry_id predates the unique_id identifiers."""
+    entry = MockConfigEntry(
+        title="Bravia Quad",
+        domain=DOMAIN,
+        data={CONF_HOST: LEGACY_UNIQUE_ID},
+        unique_id=LEGACY_UNIQUE_ID,
+        entry_id=LEGACY_ENTRY_ID,
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
 async def test_migrate_legacy_identifiers_no_migration_needed_same_ids(
     hass: HomeAssistant,
 ) -> None:
@@ -328,78 +350,54 @@ async def test_migrate_legacy_identifiers_no_migration_needed_no_unique_id(
 
 async def test_migrate_device_identifier(
     hass: HomeAssistant,
+    legacy_entry: MockConfigEntry,
 ) -> None:
     """Test device identifier migration from entry_id to unique_id format."""
-    old_entry_id = "old_entry_id"
-    new_unique_id = "192.168.1.100"
-
-    entry = MockConfigEntry(
-        title="Bravia Quad",
-        domain=DOMAIN,
-        data={CONF_HOST: "192.168.1.100"},
-        unique_id=new_unique_id,
-        entry_id=old_entry_id,
-    )
-    entry.add_to_hass(hass)
-
     device_registry = dr.async_get(hass)
 
     # Create a device with old identifier format
     device_registry.async_get_or_create(
-        config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, old_entry_id)},
+        config_entry_id=legacy_entry.entry_id,
+        identifiers=LEGACY_IDENTIFIERS,
         name="Bravia Quad",
         manufacturer="Sony",
     )
 
     # Verify old device exists
-    old_device = device_registry.async_get_device(identifiers={(DOMAIN, old_entry_id)})
+    old_device = device_registry.async_get_device(identifiers=LEGACY_IDENTIFIERS)
     assert old_device is not None
 
     # Run migration
-    migrate_legacy_identifiers(hass, entry)
+    migrate_legacy_identifiers(hass, legacy_entry)
 
     # Old identifier should no longer exist
-    old_device_after = device_registry.async_get_device(
-        identifiers={(DOMAIN, old_entry_id)}
-    )
+    old_device_after = device_registry.async_get_device(identifiers=LEGACY_IDENTIFIERS)
     assert old_device_after is None
 
     # New identifier should exist
-    new_device = device_registry.async_get_device(identifiers={(DOMAIN, new_unique_id)})
+    new_device = device_registry.async_get_device(identifiers=MIGRATED_IDENTIFIERS)
     assert new_device is not None
 
 
 async def test_migrate_device_when_new_device_exists(
     hass: HomeAssistant,
+    legacy_entry: MockConfigEntry,
 ) -> None:
     """Test device migration removes old device when new device already exists."""
-    old_entry_id = "old_entry_id"
-    new_unique_id = "192.168.1.100"
-
-    entry = MockConfigEntry(
-        title="Bravia Quad",
-        domain=DOMAIN,
-        data={CONF_HOST: "192.168.1.100"},
-        unique_id=new_unique_id,
-        entry_id=old_entry_id,
-    )
-    entry.add_to_hass(hass)
-
     device_registry = dr.async_get(hass)
 
     # Create old device with legacy identifier
     old_device = device_registry.async_get_or_create(
-        config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, old_entry_id)},
+        config_entry_id=legacy_entry.entry_id,
+        identifiers=LEGACY_IDENTIFIERS,
         name="Bravia Quad Old",
         manufacturer="Sony",
     )
 
     # Create new device with correct identifier
     new_device = device_registry.async_get_or_create(
-        config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, new_unique_id)},
+        config_entry_id=legacy_entry.entry_id,
+        identifiers=MIGRATED_IDENTIFIERS,
         name="Bravia Quad New",
         manufacturer="Sony",
     )
@@ -408,7 +406,7 @@ async def test_migrate_device_when_new_device_exists(
     new_device_id = new_device.id
 
     # Run migration
-    migrate_legacy_identifiers(hass, entry)
+    migrate_legacy_identifiers(hass, legacy_entry)
 
     # Old device should be removed
     assert device_registry.async_get(old_device_id) is None
@@ -419,29 +417,18 @@ async def test_migrate_device_when_new_device_exists(
 
 async def test_migrate_entity_unique_ids(
     hass: HomeAssistant,
+    legacy_entry: MockConfigEntry,
 ) -> None:
     """Test entity unique_id migration from entry_id to unique_id format."""
-    old_entry_id = "old_entry_id"
-    new_unique_id = "192.168.1.100"
-
-    entry = MockConfigEntry(
-        title="Bravia Quad",
-        domain=DOMAIN,
-        data={CONF_HOST: "192.168.1.100"},
-        unique_id=new_unique_id,
-        entry_id=old_entry_id,
-    )
-    entry.add_to_hass(hass)
-
     entity_registry = er.async_get(hass)
 
     # Create entities with old unique_id format
-    old_unique_id = f"{DOMAIN}_{old_entry_id}_power"
+    old_unique_id = f"{LEGACY_PREFIX}power"
     entity_registry.async_get_or_create(
         "switch",
         DOMAIN,
         old_unique_id,
-        config_entry=entry,
+        config_entry=legacy_entry,
         suggested_object_id="bravia_quad_power",
     )
 
@@ -450,14 +437,14 @@ async def test_migrate_entity_unique_ids(
     assert entity_entry is not None
 
     # Run migration
-    migrate_legacy_identifiers(hass, entry)
+    migrate_legacy_identifiers(hass, legacy_entry)
 
     # Old unique_id should no longer exist
     old_entity = entity_registry.async_get_entity_id("switch", DOMAIN, old_unique_id)
     assert old_entity is None
 
     # New unique_id should exist
-    new_unique_id_full = f"{new_unique_id}_power"
+    new_unique_id_full = f"{MIGRATED_PREFIX}power"
     new_entity = entity_registry.async_get_entity_id(
         "switch", DOMAIN, new_unique_id_full
     )
@@ -466,39 +453,28 @@ async def test_migrate_entity_unique_ids(
 
 async def test_migrate_entity_when_new_entity_exists(
     hass: HomeAssistant,
+    legacy_entry: MockConfigEntry,
 ) -> None:
     """Test entity migration removes old entity when new entity already exists."""
-    old_entry_id = "old_entry_id"
-    new_unique_id = "192.168.1.100"
-
-    entry = MockConfigEntry(
-        title="Bravia Quad",
-        domain=DOMAIN,
-        data={CONF_HOST: "192.168.1.100"},
-        unique_id=new_unique_id,
-        entry_id=old_entry_id,
-    )
-    entry.add_to_hass(hass)
-
     entity_registry = er.async_get(hass)
 
     # Create entity with old unique_id
-    old_unique_id = f"{DOMAIN}_{old_entry_id}_power"
+    old_unique_id = f"{LEGACY_PREFIX}power"
     old_entity = entity_registry.async_get_or_create(
         "switch",
         DOMAIN,
         old_unique_id,
-        config_entry=entry,
+        config_entry=legacy_entry,
         suggested_object_id="bravia_quad_power_old",
     )
 
     # Create entity with new unique_id
-    new_unique_id_full = f"{new_unique_id}_power"
+    new_unique_id_full = f"{MIGRATED_PREFIX}power"
     new_entity = entity_registry.async_get_or_create(
         "switch",
         DOMAIN,
         new_unique_id_full,
-        config_entry=entry,
+        config_entry=legacy_entry,
         suggested_object_id="bravia_quad_power_new",
     )
 
@@ -506,7 +482,7 @@ async def test_migrate_entity_when_new_entity_exists(
     new_entity_id = new_entity.entity_id
 
     # Run migration
-    migrate_legacy_identifiers(hass, entry)
+    migrate_legacy_identifiers(hass, legacy_entry)
 
     # Old entity should be removed
     assert entity_registry.async_get(old_entity_id) is None
@@ -517,20 +493,9 @@ async def test_migrate_entity_when_new_entity_exists(
 
 async def test_migrate_multiple_entities(
     hass: HomeAssistant,
+    legacy_entry: MockConfigEntry,
 ) -> None:
     """Test migration handles multiple entities correctly."""
-    old_entry_id = "old_entry_id"
-    new_unique_id = "192.168.1.100"
-
-    entry = MockConfigEntry(
-        title="Bravia Quad",
-        domain=DOMAIN,
-        data={CONF_HOST: "192.168.1.100"},
-        unique_id=new_unique_id,
-        entry_id=old_entry_id,
-    )
-    entry.add_to_hass(hass)
-
     entity_registry = er.async_get(hass)
 
     # Create multiple entities with old unique_id format
@@ -540,21 +505,21 @@ async def test_migrate_multiple_entities(
         "input": "select",
     }
     for suffix, domain in suffix_to_domain.items():
-        old_unique_id = f"{DOMAIN}_{old_entry_id}_{suffix}"
+        old_unique_id = f"{LEGACY_PREFIX}{suffix}"
         entity_registry.async_get_or_create(
             domain,
             DOMAIN,
             old_unique_id,
-            config_entry=entry,
+            config_entry=legacy_entry,
         )
 
     # Run migration
-    migrate_legacy_identifiers(hass, entry)
+    migrate_legacy_identifiers(hass, legacy_entry)
 
     # All entities should be migrated
     for suffix, domain in suffix_to_domain.items():
-        old_unique_id = f"{DOMAIN}_{old_entry_id}_{suffix}"
-        new_unique_id_full = f"{new_unique_id}_{suffix}"
+        old_unique_id = f"{LEGACY_PREFIX}{suffix}"
+        new_unique_id_full = f"{MIGRATED_PREFIX}{suffix}"
 
         # Old should not exist
         old_entity = entity_registry.async_get_entity_id(domain, DOMAIN, old_unique_id)
@@ -569,20 +534,9 @@ async def test_migrate_multiple_entities(
 
 async def test_migrate_skips_non_matching_entities(
     hass: HomeAssistant,
+    legacy_entry: MockConfigEntry,
 ) -> None:
     """Test migration skips entities that don't match the old prefix."""
-    old_entry_id = "old_entry_id"
-    new_unique_id = "192.168.1.100"
-
-    entry = MockConfigEntry(
-        title="Bravia Quad",
-        domain=DOMAIN,
-        data={CONF_HOST: "192.168.1.100"},
-        unique_id=new_unique_id,
-        entry_id=old_entry_id,
-    )
-    entry.add_to_hass(hass)
-
     entity_registry = er.async_get(hass)
 
     # Create entity with a different prefix (already migrated or different format)
@@ -591,11 +545,11 @@ async def test_migrate_skips_non_matching_entities(
         "switch",
         DOMAIN,
         other_unique_id,
-        config_entry=entry,
+        config_entry=legacy_entry,
     )
 
     # Run migration
-    migrate_legacy_identifiers(hass, entry)
+    migrate_legacy_identifiers(hass, legacy_entry)
 
     # Entity should remain unchanged
     entity = entity_registry.async_get_entity_id("switch", DOMAIN, other_unique_id)
@@ -604,19 +558,11 @@ async def test_migrate_skips_non_matching_entities(
 
 async def test_migrate_no_old_device(
     hass: HomeAssistant,
+    legacy_entry: MockConfigEntry,
 ) -> None:
     """Test migration handles case when no old device exists."""
-    entry = MockConfigEntry(
-        title="Bravia Quad",
-        domain=DOMAIN,
-        data={CONF_HOST: "192.168.1.100"},
-        unique_id="192.168.1.100",
-        entry_id="old_entry_id",
-    )
-    entry.add_to_hass(hass)
-
     # No device created - migration should handle gracefully
-    migrate_legacy_identifiers(hass, entry)  # Should not raise
+    migrate_legacy_identifiers(hass, legacy_entry)  # Should not raise
 
 
 async def test_migrate_from_ip_based_device_and_entities(
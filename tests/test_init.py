@@ -79,20 +79,14 @@ async def test_unload_entry_without_runtime_data(
 async def test_setup_entry_connection_error(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
+    mock_bravia_quad_client: MagicMock,
 ) -> None:
     """Test setup entry when connection fails."""
     mock_config_entry.add_to_hass(hass)
 
-    with (
-        patch(
-            "custom_components.bravia_quad.BraviaQuadClient",
-            autospec=True,
-        ) as client_mock,
-        patch("custom_components.bravia_quad.PLATFORMS", [Platform.SWITCH]),
-    ):
-        client = client_mock.return_value
-        client.async_connect.side_effect = OSError("Connection refused")
+    mock_bravia_quad_client.async_connect.side_effect = OSError("Connection refused")
 
+    with patch("custom_components.bravia_quad.PLATFORMS", [Platform.SWITCH]):
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 from homeassistant.components.media_player import (
@@ -26,11 +26,19 @@ from homeassistant.const import ATTR_ENTITY_ID, ATTR_SUPPORTED_FEATURES, Platfor
 
 from custom_components.bravia_quad.const import DOMAIN
 
+from .conftest import get_registered_callback
+
 if TYPE_CHECKING:
     from unittest.mock import MagicMock
 
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers import entity_registry as er
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+MEDIA_PLAYER_ENTITY_ID_PREFIXES = (
+    f"{MEDIA_PLAYER_DOMAIN}.{DOMAIN}",
+    f"{MEDIA_PLAYER_DOMAIN}.bravia",
+)
 
 
 @pytest.fixture
@@ -39,27 +47,27 @@ def platforms() -> list[Platform]:
     return [Platform.MEDIA_PLAYER]
 
 
-def _get_media_player_entity_id(hass: HomeAssistant) -> str:
-    """Get the media player entity ID."""
+@pytest.fixture
+def media_player_entity_id(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> str:
+    """Return the entity ID of the set-up media player."""
     entity_ids = [
         entity_id
         for entity_id in hass.states.async_entity_ids(MEDIA_PLAYER_DOMAIN)
-        if entity_id.startswith(
-            (f"{MEDIA_PLAYER_DOMAIN}.{DOMAIN}", f"{MEDIA_PLAYER_DOMAIN}.bravia")
-        )
+        if entity_id.startswith(MEDIA_PLAYER_ENTITY_ID_PREFIXES)
     ]
     assert len(entity_ids) == 1, f"Expected 1 media player entity, found {entity_ids}"
     return entity_ids[0]
 
 
-@pytest.mark.usefixtures("init_integration")
 async def test_media_player_entity_created(
     hass: HomeAssistant,
+    media_player_entity_id: str,
     entity_registry: er.EntityRegistry,
 ) -> None:
     """Test media player entity is created correctly."""
-    entity_id = _get_media_player_entity_id(hass)
-    state = hass.states.get(entity_id)
+    state = hass.states.get(media_player_entity_id)
 
     assert state is not None
     assert state.state == MediaPlayerState.ON
@@ -81,65 +89,75 @@ async def test_media_player_entity_created(
     assert state.attributes[ATTR_INPUT_SOURCE] == "tv"
 
 
-@pytest.mark.usefixtures("init_integration")
-async def test_media_player_turn_on(
+@pytest.mark.parametrize(
+    ("service", "service_data", "client_method", "expected_arg"),
+    [
+        (SERVICE_TURN_ON, {}, "async_set_power", "on"),
+        # Default volume is 50, so a step moves it by one
+        (SERVICE_VOLUME_UP, {}, "async_set_volume", 51),
+        (SERVICE_VOLUME_DOWN, {}, "async_set_volume", 49),
+        (
+            SERVICE_SELECT_SOURCE,
+            {ATTR_INPUT_SOURCE: "spotify"},
+            "async_set_input",
+            "spotify",
+        ),
+    ],
+    ids=["turn_on", "volume_up", "volume_down", "select_source_spotify"],
+)
+async def test_media_player_service_dispatch(
     hass: HomeAssistant,
+    media_player_entity_id: str,
     mock_bravia_quad_client: MagicMock,
+    service: str,
+    service_data: dict[str, Any],
+    client_method: str,
+    expected_arg: str | int,
 ) -> None:
-    """Test turning on the media player."""
-    entity_id = _get_media_player_entity_id(hass)
-
-    mock_bravia_quad_client.async_set_power.return_value = True
+    """Test media player services call the matching client method."""
+    method = getattr(mock_bravia_quad_client, client_method)
 
     await hass.services.async_call(
         MEDIA_PLAYER_DOMAIN,
-        SERVICE_TURN_ON,
-        {ATTR_ENTITY_ID: entity_id},
+        service,
+        {ATTR_ENTITY_ID: media_player_entity_id, **service_data},
         blocking=True,
     )
 
-    mock_bravia_quad_client.async_set_power.assert_called_once_with("on")
+    method.assert_called_once_with(expected_arg)
 
 
-@pytest.mark.usefixtures("init_integration")
 async def test_media_player_turn_off(
     hass: HomeAssistant,
+    media_player_entity_id: str,
     mock_bravia_quad_client: MagicMock,
 ) -> None:
     """Test turning off the media player."""
-    entity_id = _get_media_player_entity_id(hass)
-
-    mock_bravia_quad_client.async_set_power.return_value = True
-
     await hass.services.async_call(
         MEDIA_PLAYER_DOMAIN,
         SERVICE_TURN_OFF,
-        {ATTR_ENTITY_ID: entity_id},
+        {ATTR_ENTITY_ID: media_player_entity_id},
         blocking=True,
     )
 
     mock_bravia_quad_client.async_set_power.assert_called_once_with("off")
 
     # Verify state updated
-    state = hass.states.get(entity_id)
+    state = hass.states.get(media_player_entity_id)
     assert state.state == MediaPlayerState.OFF
 
 
-@pytest.mark.usefixtures("init_integration")
 async def test_media_player_set_volume(
     hass: HomeAssistant,
+    media_player_entity_id: str,
     mock_bravia_quad_client: MagicMock,
 ) -> None:
     """Test setting volume level."""
-    entity_id = _get_media_player_entity_id(hass)
-
-    mock_bravia_quad_client.async_set_volume.return_value = True
-
     await hass.services.async_call(
         MEDIA_PLAYER_DOMAIN,
         SERVICE_VOLUME_SET,
         {
-            ATTR_ENTITY_ID: entity_id,
+            ATTR_ENTITY_ID: media_player_entity_id,
             ATTR_MEDIA_VOLUME_LEVEL: 0.75,
         },
         blocking=True,
@@ -149,67 +167,21 @@ async def test_media_player_set_volume(
     mock_bravia_quad_client.async_set_volume.assert_called_once_with(75)
 
     # Verify state updated
-    state = hass.states.get(entity_id)
+    state = hass.states.get(media_player_entity_id)
     assert state.attributes[ATTR_MEDIA_VOLUME_LEVEL] == 0.75
 
 
-@pytest.mark.usefixtures("init_integration")
-async def test_media_player_volume_up(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-) -> None:
-    """Test volume up."""
-    entity_id = _get_media_player_entity_id(hass)
-
-    mock_bravia_quad_client.async_set_volume.return_value = True
-
-    await hass.services.async_call(
-        MEDIA_PLAYER_DOMAIN,
-        SERVICE_VOLUME_UP,
-        {ATTR_ENTITY_ID: entity_id},
-        blocking=True,
-    )
-
-    # Default volume is 50, so should call with 51
-    mock_bravia_quad_client.async_set_volume.assert_called_once_with(51)
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_media_player_volume_down(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-) -> None:
-    """Test volume down."""
-    entity_id = _get_media_player_entity_id(hass)
-
-    mock_bravia_quad_client.async_set_volume.return_value = True
-
-    await hass.services.async_call(
-        MEDIA_PLAYER_DOMAIN,
-        SERVICE_VOLUME_DOWN,
-        {ATTR_ENTITY_ID: entity_id},
-        blocking=True,
-    )
-
-    # Default volume is 50, so should call with 49
-    mock_bravia_quad_client.async_set_volume.assert_called_once_with(49)
-
-
-@pytest.mark.usefixtures("init_integration")
 async def test_media_player_select_source(
     hass: HomeAssistant,
+    media_player_entity_id: str,
     mock_bravia_quad_client: MagicMock,
 ) -> None:
     """Test selecting input source."""
-    entity_id = _get_media_player_entity_id(hass)
-
-    mock_bravia_quad_client.async_set_input.return_value = True
-
     await hass.services.async_call(
         MEDIA_PLAYER_DOMAIN,
         SERVICE_SELECT_SOURCE,
         {
-            ATTR_ENTITY_ID: entity_id,
+            ATTR_ENTITY_ID: media_player_entity_id,
             ATTR_INPUT_SOURCE: "hdmi1",
         },
         blocking=True,
@@ -218,40 +190,16 @@ async def test_media_player_select_source(
     mock_bravia_quad_client.async_set_input.assert_called_once_with("hdmi1")
 
     # Verify state updated
-    state = hass.states.get(entity_id)
+    state = hass.states.get(media_player_entity_id)
     assert state.attributes[ATTR_INPUT_SOURCE] == "hdmi1"
 
 
-@pytest.mark.usefixtures("init_integration")
-async def test_media_player_select_source_spotify(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-) -> None:
-    """Test selecting Spotify source."""
-    entity_id = _get_media_player_entity_id(hass)
-
-    mock_bravia_quad_client.async_set_input.return_value = True
-
-    await hass.services.async_call(
-        MEDIA_PLAYER_DOMAIN,
-        SERVICE_SELECT_SOURCE,
-        {
-            ATTR_ENTITY_ID: entity_id,
-            ATTR_INPUT_SOURCE: "spotify",
-        },
-        blocking=True,
-    )
-
-    mock_bravia_quad_client.async_set_input.assert_called_once_with("spotify")
-
-
-@pytest.mark.usefixtures("init_integration")
 async def test_media_player_source_list(
     hass: HomeAssistant,
+    media_player_entity_id: str,
 ) -> None:
     """Test source list contains all expected sources."""
-    entity_id = _get_media_player_entity_id(hass)
-    state = hass.states.get(entity_id)
+    state = hass.states.get(media_player_entity_id)
 
     expected_sources = ["tv", "hdmi1", "spotify", "bluetooth", "airplay2"]
     assert state.attributes["source_list"] == expected_sources
@@ -267,54 +215,48 @@ async def test_media_player_notification_callbacks_registered(
     callback_calls = (
         mock_bravia_quad_client.register_notification_callback.call_args_list
     )
-    registered_features = [call[0][0] for call in callback_calls]
+    registered_features = {call[0][0] for call in callback_calls}
 
-    assert "main.power" in registered_features
-    assert "main.volumestep" in registered_features
-    assert "main.input" in registered_features
-    assert "main.mute" in registered_features
+    assert registered_features >= {
+        "main.power",
+        "main.volumestep",
+        "main.input",
+        "main.mute",
+    }
 
 
-@pytest.mark.usefixtures("init_integration")
 async def test_media_player_off_state(
     hass: HomeAssistant,
+    media_player_entity_id: str,
     mock_bravia_quad_client: MagicMock,
 ) -> None:
     """Test media player shows OFF state when power is off."""
     # Setup with power off
     mock_bravia_quad_client.power_state = "off"
 
-    # Reload to get new state
-    entity_id = _get_media_player_entity_id(hass)
-
     # Simulate power off via service
-    mock_bravia_quad_client.async_set_power.return_value = True
     await hass.services.async_call(
         MEDIA_PLAYER_DOMAIN,
         SERVICE_TURN_OFF,
-        {ATTR_ENTITY_ID: entity_id},
+        {ATTR_ENTITY_ID: media_player_entity_id},
         blocking=True,
     )
 
-    state = hass.states.get(entity_id)
+    state = hass.states.get(media_player_entity_id)
     assert state.state == MediaPlayerState.OFF
 
 
-@pytest.mark.usefixtures("init_integration")
 async def test_media_player_mute(
     hass: HomeAssistant,
+    media_player_entity_id: str,
     mock_bravia_quad_client: MagicMock,
 ) -> None:
     """Test muting the media player."""
-    entity_id = _get_media_player_entity_id(hass)
-
-    mock_bravia_quad_client.async_set_mute.return_value = True
-
     await hass.services.async_call(
         MEDIA_PLAYER_DOMAIN,
         SERVICE_VOLUME_MUTE,
         {
-            ATTR_ENTITY_ID: entity_id,
+            ATTR_ENTITY_ID: media_player_entity_id,
             ATTR_MEDIA_VOLUME_MUTED: True,
         },
         blocking=True,
@@ -323,25 +265,21 @@ async def test_media_player_mute(
     mock_bravia_quad_client.async_set_mute.assert_called_once_with("on")
 
     # Verify state updated
-    state = hass.states.get(entity_id)
+    state = hass.states.get(media_player_entity_id)
     assert state.attributes[ATTR_MEDIA_VOLUME_MUTED] is True
 
 
-@pytest.mark.usefixtures("init_integration")
 async def test_media_player_unmute(
     hass: HomeAssistant,
+    media_player_entity_id: str,
     mock_bravia_quad_client: MagicMock,
 ) -> None:
     """Test unmuting the media player."""
-    entity_id = _get_media_player_entity_id(hass)
-
-    mock_bravia_quad_client.async_set_mute.return_value = True
-
     await hass.services.async_call(
         MEDIA_PLAYER_DOMAIN,
         SERVICE_VOLUME_MUTE,
         {
-            ATTR_ENTITY_ID: entity_id,
+            ATTR_ENTITY_ID: media_player_entity_id,
             ATTR_MEDIA_VOLUME_MUTED: False,
         },
         blocking=True,
@@ -350,38 +288,27 @@ async def test_media_player_unmute(
     mock_bravia_quad_client.async_set_mute.assert_called_once_with("off")
 
     # Verify state updated
-    state = hass.states.get(entity_id)
+    state = hass.states.get(media_player_entity_id)
     assert state.attributes[ATTR_MEDIA_VOLUME_MUTED] is False
 
 
-@pytest.mark.usefixtures("init_integration")
 async def test_media_player_mute_notification(
     hass: HomeAssistant,
+    media_player_entity_id: str,
     mock_bravia_quad_client: MagicMock,
 ) -> None:
     """Test mute notification updates state."""
-    entity_id = _get_media_player_entity_id(hass)
-
-    # Find the mute notification callback
-    callback_calls = (
-        mock_bravia_quad_client.register_notification_callback.call_args_list
-    )
-    mute_callback = None
-    for call in callback_calls:
-        if call[0][0] == "main.mute":
-            mute_callback = call[0][1]
-            break
-
+    mute_callback = get_registered_callback(mock_bravia_quad_client, "main.mute")
     assert mute_callback is not None
 
     # Simulate mute notification from device
     await mute_callback("on")
 
-    state = hass.states.get(entity_id)
+    state = hass.states.get(media_player_entity_id)
     assert state.attributes[ATTR_MEDIA_VOLUME_MUTED] is True
 
     # Simulate unmute notification
     await mute_callback("off")
 
-    state = hass.states.get(entity_id)
+    state = hass.states.get(media_player_entity_id)
     assert state.attributes[ATTR_MEDIA_VOLUME_MUTED] is False
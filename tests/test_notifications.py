@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import TYPE_CHECKING, NamedTuple
 
 import pytest
-from homeassistant.const import Platform
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_STATE_CHANGED,
+    SERVICE_TURN_OFF,
+    Platform,
+)
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_capture_events,
+    async_fire_time_changed,
+)
 
 from custom_components.bravia_quad.const import (
     FEATURE_AAV,
@@ -22,14 +33,15 @@ from custom_components.bravia_quad.const import (
     FEATURE_VOICE_ENHANCER,
     FEATURE_VOLUME,
 )
+from custom_components.bravia_quad.entity import NOTIFICATION_DEBOUNCE_SECONDS
 
 from .conftest import (
     _setup_integration_with_suffixes_enabled,
     get_entity_id_by_unique_id_suffix,
+    get_registered_callback,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
     from unittest.mock import MagicMock
 
     from homeassistant.core import HomeAssistant
@@ -60,39 +72,47 @@ class SelectTestCase(NamedTuple):
 
     entity_suffix: str
     feature: str
-    test_values: list[str]
+    test_values: tuple[str, ...]
 
 
 # Expected notification features by platform
-SWITCH_FEATURES = {
-    FEATURE_POWER,
-    FEATURE_HDMI_CEC,
-    FEATURE_AUTO_STANDBY,
-    FEATURE_VOICE_ENHANCER,
-    FEATURE_SOUND_FIELD,
-    FEATURE_NIGHT_MODE,
-    FEATURE_AAV,
-}
+SWITCH_FEATURES = frozenset(
+    {
+        FEATURE_POWER,
+        FEATURE_HDMI_CEC,
+        FEATURE_AUTO_STANDBY,
+        FEATURE_VOICE_ENHANCER,
+        FEATURE_SOUND_FIELD,
+        FEATURE_NIGHT_MODE,
+        FEATURE_AAV,
+    }
+)
 
-NUMBER_FEATURES = {
-    FEATURE_VOLUME,
-    FEATURE_REAR_LEVEL,
-    FEATURE_BASS_LEVEL,
-}
+NUMBER_FEATURES = frozenset(
+    {
+        FEATURE_VOLUME,
+        FEATURE_REAR_LEVEL,
+        FEATURE_BASS_LEVEL,
+    }
+)
 
-SELECT_FEATURES = {
-    FEATURE_DRC,
-}
+SELECT_FEATURES = frozenset({FEATURE_DRC})
 
-MEDIA_PLAYER_FEATURES = {
-    FEATURE_INPUT,
-    FEATURE_MUTE,
-    FEATURE_POWER,
-    FEATURE_VOLUME,
-}
+MEDIA_PLAYER_FEATURES = frozenset(
+    {
+        FEATURE_INPUT,
+        FEATURE_MUTE,
+        FEATURE_POWER,
+        FEATURE_VOLUME,
+    }
+)
+
+ALL_EXPECTED_FEATURES = (
+    SWITCH_FEATURES | NUMBER_FEATURES | SELECT_FEATURES | MEDIA_PLAYER_FEATURES
+)
 
 # Test case definitions
-SWITCH_TEST_CASES = [
+SWITCH_TEST_CASES = (
     SwitchTestCase("_power", FEATURE_POWER, "on", "off"),
     SwitchTestCase("_hdmi_cec", FEATURE_HDMI_CEC, "on", "off"),
     SwitchTestCase("_auto_standby", FEATURE_AUTO_STANDBY, "on", "off"),
@@ -100,17 +120,15 @@ SWITCH_TEST_CASES = [
     SwitchTestCase("_sound_field", FEATURE_SOUND_FIELD, "on", "off"),
     SwitchTestCase("_voice_enhancer", FEATURE_VOICE_ENHANCER, "upon", "upoff"),
     SwitchTestCase("_advanced_auto_volume", FEATURE_AAV, "on", "off"),
-]
+)
 
-NUMBER_TEST_CASES = [
+NUMBER_TEST_CASES = (
     NumberTestCase("_volume", FEATURE_VOLUME, "50", "75"),
     NumberTestCase("_rear_level", FEATURE_REAR_LEVEL, "0", "5"),
     NumberTestCase("_bass_level_slider", FEATURE_BASS_LEVEL, "0", "-3"),
-]
+)
 
-SELECT_TEST_CASES = [
-    SelectTestCase("_drc", FEATURE_DRC, ["on", "off", "auto"]),
-]
+SELECT_TEST_CASES = (SelectTestCase("_drc", FEATURE_DRC, ("on", "off", "auto")),)
 
 NOTIFICATION_ENTITY_SUFFIXES = [
     *(tc.entity_suffix for tc in SWITCH_TEST_CASES),
@@ -119,17 +137,12 @@ NOTIFICATION_ENTITY_SUFFIXES = [
 ]
 
 
-def _get_registered_callback(mock_client: MagicMock, feature: str) -> Callable | None:
-    """Get the callback registered for a specific feature.
-
-    Returns the last registered callback for the feature, which is important
-    when init_integration_notifications reloads the integration after enabling entities.
-    """
-    callback = None
-    for call_args in mock_client.register_notification_callback.call_args_list:
-        if call_args[0][0] == feature:
-            callback = call_args[0][1]
-    return callback
+async def _async_flush_debounced(hass: HomeAssistant) -> None:
+    """Advance past the notification debounce window and settle."""
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=NOTIFICATION_DEBOUNCE_SECONDS * 2)
+    )
+    await hass.async_block_till_done()
 
 
 @pytest.fixture
@@ -166,11 +179,8 @@ async def test_callbacks_registered_on_setup(
     registered_features = {call_args[0][0] for call_args in register_calls}
 
     # Test all platform features are registered
-    all_expected = (
-        SWITCH_FEATURES | NUMBER_FEATURES | SELECT_FEATURES | MEDIA_PLAYER_FEATURES
-    )
-    for feature in all_expected:
-        assert feature in registered_features, f"Feature {feature} not registered"
+    missing = ALL_EXPECTED_FEATURES - registered_features
+    assert not missing, f"Features not registered: {sorted(missing)}"
 
 
 @pytest.mark.usefixtures("init_integration_notifications")
@@ -220,24 +230,93 @@ async def test_switch_notification_updates_state(
     )
     assert entity_id is not None, f"Entity {test_case.entity_suffix} not found"
 
-    callback = _get_registered_callback(mock_bravia_quad_client, test_case.feature)
+    callback = get_registered_callback(mock_bravia_quad_client, test_case.feature)
     assert callback is not None, f"Callback for {test_case.feature} not registered"
 
     # Turn on via notification
     await callback(test_case.on_value)
-    await hass.async_block_till_done()
+    await _async_flush_debounced(hass)
     state = hass.states.get(entity_id)
     assert state.state == "on", f"Expected 'on' after {test_case.on_value} notification"
 
     # Turn off via notification
     await callback(test_case.off_value)
-    await hass.async_block_till_done()
+    await _async_flush_debounced(hass)
     state = hass.states.get(entity_id)
     assert state.state == "off", (
         f"Expected 'off' after {test_case.off_value} notification"
     )
 
 
+@pytest.mark.usefixtures("init_integration_notifications")
+async def test_switch_notification_burst_is_coalesced(
+    hass: HomeAssistant,
+    mock_bravia_quad_client: MagicMock,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test that a burst of switch notifications causes a single state write."""
+    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_night_mode")
+    assert entity_id is not None
+
+    callback = get_registered_callback(mock_bravia_quad_client, FEATURE_NIGHT_MODE)
+    assert callback is not None
+
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    for value in ("on", "off", "on"):
+        await callback(value)
+    await hass.async_block_till_done()
+    assert not [event for event in events if event.data["entity_id"] == entity_id]
+
+    await _async_flush_debounced(hass)
+    writes = [event for event in events if event.data["entity_id"] == entity_id]
+    assert len(writes) == 1
+    assert writes[0].data["new_state"].state == "on"
+
+
+@pytest.mark.usefixtures("init_integration_notifications")
+async def test_switch_notification_matching_state_is_dropped(
+    hass: HomeAssistant,
+    mock_bravia_quad_client: MagicMock,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test that a notification repeating the current state writes nothing."""
+    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_night_mode")
+    assert entity_id is not None
+    assert hass.states.get(entity_id).state == "off"
+
+    callback = get_registered_callback(mock_bravia_quad_client, FEATURE_NIGHT_MODE)
+    assert callback is not None
+
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    await callback("off")
+    await _async_flush_debounced(hass)
+
+    assert not [event for event in events if event.data["entity_id"] == entity_id]
+
+
+@pytest.mark.usefixtures("init_integration_notifications")
+async def test_switch_command_drops_pending_notification(
+    hass: HomeAssistant,
+    mock_bravia_quad_client: MagicMock,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test that a command discards a stale notification still being debounced."""
+    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_night_mode")
+    assert entity_id is not None
+
+    callback = get_registered_callback(mock_bravia_quad_client, FEATURE_NIGHT_MODE)
+    assert callback is not None
+
+    # Stale "on" arrives just before the user turns the switch off
+    await callback("on")
+    await hass.services.async_call(
+        "switch", SERVICE_TURN_OFF, {ATTR_ENTITY_ID: entity_id}, blocking=True
+    )
+    await _async_flush_debounced(hass)
+
+    assert hass.states.get(entity_id).state == "off"
+
+
 # --- Number Notification State Update Tests ---
 
 
@@ -259,7 +338,7 @@ async def test_number_notification_updates_state(
     )
     assert entity_id is not None, f"Entity {test_case.entity_suffix} not found"
 
-    callback = _get_registered_callback(mock_bravia_quad_client, test_case.feature)
+    callback = get_registered_callback(mock_bravia_quad_client, test_case.feature)
     assert callback is not None, f"Callback for {test_case.feature} not registered"
 
     # Verify initial state
@@ -295,7 +374,7 @@ async def test_select_notification_updates_state(
     )
     assert entity_id is not None, f"Entity {test_case.entity_suffix} not found"
 
-    callback = _get_registered_callback(mock_bravia_quad_client, test_case.feature)
+    callback = get_registered_callback(mock_bravia_quad_client, test_case.feature)
     assert callback is not None, f"Callback for {test_case.feature} not registered"
 
     for value in test_case.test_values:
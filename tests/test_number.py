@@ -10,14 +10,17 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from homeassistant.const import ATTR_ENTITY_ID, Platform
 from homeassistant.helpers import entity_registry as er
-from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from .conftest import get_entity_id_by_unique_id_suffix
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from unittest.mock import MagicMock
 
     from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+    from custom_components.bravia_quad.number import BraviaQuadVolumeNumber
 
 NUMBER_DOMAIN = "number"
 
@@ -28,6 +31,29 @@ def platforms() -> list[Platform]:
     return [Platform.NUMBER]
 
 
+@pytest.fixture
+def mock_transition_sleep() -> Generator[AsyncMock]:
+    """Make volume transition step delays return immediately."""
+    with patch(
+        "custom_components.bravia_quad.entity.asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture
+def volume_entity(
+    hass: HomeAssistant,
+    init_integration_volume: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+) -> BraviaQuadVolumeNumber:
+    """Return the set-up volume number entity."""
+    volume_id = get_entity_id_by_unique_id_suffix(entity_registry, "_volume")
+    assert volume_id is not None
+    entity = hass.data[NUMBER_DOMAIN].get_entity(volume_id)
+    assert entity is not None
+    return entity
+
+
 @pytest.mark.usefixtures("init_integration")
 async def test_number_entities(
     hass: HomeAssistant,
@@ -57,85 +83,38 @@ async def test_number_entities(
         assert state is None, f"Expected {suffix} to be disabled"
 
 
+@pytest.mark.parametrize(
+    ("suffix", "client_method", "value"),
+    [
+        ("_volume", "async_set_volume", 75),
+        ("_rear_level", "async_set_rear_level", 5),
+        ("_bass_level_slider", "async_set_bass_level", 3),
+    ],
+    ids=["volume", "rear_level", "bass_level"],
+)
 @pytest.mark.usefixtures("init_integration_volume")
-async def test_volume_number_set_value(
+async def test_number_set_value(
     hass: HomeAssistant,
     mock_bravia_quad_client: MagicMock,
     entity_registry: er.EntityRegistry,
+    suffix: str,
+    client_method: str,
+    value: int,
 ) -> None:
-    """Test setting the volume value."""
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_volume")
+    """Test setting a device-backed number value."""
+    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, suffix)
     assert entity_id is not None
 
-    # Verify initial state
-    state = hass.states.get(entity_id)
-    assert state is not None
-    assert state.state == "50"  # Mock default value
-
-    mock_bravia_quad_client.async_set_volume.return_value = True
+    method = getattr(mock_bravia_quad_client, client_method)
 
     await hass.services.async_call(
         NUMBER_DOMAIN,
         "set_value",
-        {ATTR_ENTITY_ID: entity_id, "value": 75},
+        {ATTR_ENTITY_ID: entity_id, "value": value},
         blocking=True,
     )
 
-    mock_bravia_quad_client.async_set_volume.assert_called_once_with(75)
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_rear_level_number_set_value(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test setting the rear level value."""
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_rear_level")
-    assert entity_id is not None
-
-    # Verify initial state
-    state = hass.states.get(entity_id)
-    assert state is not None
-    assert state.state == "0"  # Mock default value
-
-    mock_bravia_quad_client.async_set_rear_level.return_value = True
-
-    await hass.services.async_call(
-        NUMBER_DOMAIN,
-        "set_value",
-        {ATTR_ENTITY_ID: entity_id, "value": 5},
-        blocking=True,
-    )
-
-    mock_bravia_quad_client.async_set_rear_level.assert_called_once_with(5)
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_bass_level_number_set_value(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test setting the bass level value (with subwoofer)."""
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_bass_level_slider")
-    assert entity_id is not None
-
-    # Verify initial state (bass level slider is created when has_subwoofer=True)
-    state = hass.states.get(entity_id)
-    assert state is not None
-    assert state.state == "0"  # Mock default value
-
-    mock_bravia_quad_client.async_set_bass_level.return_value = True
-
-    await hass.services.async_call(
-        NUMBER_DOMAIN,
-        "set_value",
-        {ATTR_ENTITY_ID: entity_id, "value": 3},
-        blocking=True,
-    )
-
-    mock_bravia_quad_client.async_set_bass_level.assert_called_once_with(3)
+    method.assert_called_once_with(value)
 
 
 @pytest.mark.usefixtures("init_integration")
@@ -150,11 +129,6 @@ async def test_volume_step_interval_number_set_value(
     )
     assert entity_id is not None
 
-    # Verify initial state
-    state = hass.states.get(entity_id)
-    assert state is not None
-    assert state.state == "0"
-
     await hass.services.async_call(
         NUMBER_DOMAIN,
         "set_value",
@@ -171,6 +145,7 @@ async def test_volume_step_interval_number_set_value(
 async def test_volume_step_interval_logic(
     hass: HomeAssistant,
     mock_bravia_quad_client: MagicMock,
+    mock_transition_sleep: AsyncMock,
     entity_registry: er.EntityRegistry,
 ) -> None:
     """Test volume step interval logic."""
@@ -189,26 +164,19 @@ async def test_volume_step_interval_logic(
     assert mock_bravia_quad_client.volume_step_interval == 100
 
     # Set volume from 50 to 52 (2 steps)
-    mock_bravia_quad_client.async_set_volume.return_value = True
-
-    # We need to patch sleep to avoid waiting
-    with patch(
-        "custom_components.bravia_quad.entity.asyncio.sleep", new_callable=AsyncMock
-    ) as mock_sleep:
-        await hass.services.async_call(
-            NUMBER_DOMAIN,
-            "set_value",
-            {ATTR_ENTITY_ID: volume_id, "value": 52},
-            blocking=True,
-        )
-        # Wait for the background task to complete
-        await hass.async_block_till_done()
+    await hass.services.async_call(
+        NUMBER_DOMAIN,
+        "set_value",
+        {ATTR_ENTITY_ID: volume_id, "value": 52},
+    )
+    # One drain runs the service call and the transition it starts
+    await hass.async_block_till_done()
 
     # Should have called sleep(0.1) twice (before each step)
     # Note: call_count might be higher if other parts of the system call sleep
-    assert mock_sleep.call_count >= 2
-    assert mock_sleep.call_args_list[0][0][0] == 0.1
-    assert mock_sleep.call_args_list[1][0][0] == 0.1
+    assert mock_transition_sleep.call_count >= 2
+    assert mock_transition_sleep.call_args_list[0][0][0] == 0.1
+    assert mock_transition_sleep.call_args_list[1][0][0] == 0.1
 
     # Should have called async_set_volume for each step: 51, 52
     assert mock_bravia_quad_client.async_set_volume.call_count == 2
@@ -216,14 +184,15 @@ async def test_volume_step_interval_logic(
     mock_bravia_quad_client.async_set_volume.assert_any_call(52)
 
 
-@pytest.mark.usefixtures("init_integration_volume")
+@pytest.mark.usefixtures("mock_transition_sleep")
 async def test_volume_step_interval_race_condition(
     hass: HomeAssistant,
     mock_bravia_quad_client: MagicMock,
     entity_registry: er.EntityRegistry,
+    volume_entity: BraviaQuadVolumeNumber,
 ) -> None:
-    """Test race condition where multiple transitions are started."""
-    volume_id = get_entity_id_by_unique_id_suffix(entity_registry, "_volume")
+    """Test that a new transition supersedes the one already running."""
+    volume_id = volume_entity.entity_id
     interval_id = get_entity_id_by_unique_id_suffix(
         entity_registry, "_volume_step_interval"
     )
@@ -236,88 +205,72 @@ async def test_volume_step_interval_race_condition(
         blocking=True,
     )
 
-    # Track how many transitions are active
-    active_transitions = 0
-    max_active_transitions = 0
+    step_started = asyncio.Event()
+    release_steps = asyncio.Event()
 
     async def mock_set_volume(val: int) -> bool:
-        nonlocal active_transitions, max_active_transitions
-        active_transitions += 1
-        max_active_transitions = max(max_active_transitions, active_transitions)
-        await asyncio.sleep(0.01)
-        active_transitions -= 1
+        step_started.set()
+        await release_steps.wait()
         return True
 
     mock_bravia_quad_client.async_set_volume.side_effect = mock_set_volume
 
-    with patch(
-        "custom_components.bravia_quad.entity.asyncio.sleep", new_callable=AsyncMock
-    ):
-        # Start first transition
+    # Start each transition while the previous one is parked mid-step
+    tasks: list[asyncio.Task[None]] = []
+    for target in (60, 70, 80):
+        step_started.clear()
         await hass.services.async_call(
             NUMBER_DOMAIN,
             "set_value",
-            {ATTR_ENTITY_ID: volume_id, "value": 60},
+            {ATTR_ENTITY_ID: volume_id, "value": target},
             blocking=True,
         )
-        await asyncio.sleep(0.02)
-
-        # Start second transition immediately
-        await hass.services.async_call(
-            NUMBER_DOMAIN,
-            "set_value",
-            {ATTR_ENTITY_ID: volume_id, "value": 70},
-            blocking=True,
-        )
-        await asyncio.sleep(0.02)
-
-        # Start third transition
-        await hass.services.async_call(
-            NUMBER_DOMAIN,
-            "set_value",
-            {ATTR_ENTITY_ID: volume_id, "value": 80},
-            blocking=True,
-        )
-
-        # Wait for all transitions to complete
-        await hass.async_block_till_done()
-
-    assert max_active_transitions == 1
-
+        await asyncio.wait_for(step_started.wait(), timeout=1)
+        assert volume_entity._transition_task is not None
+        tasks.append(volume_entity._transition_task)
+
+    # Superseded transitions wind down without their parked step returning
+    *superseded, surviving = tasks
+    _, still_running = await asyncio.wait(superseded, timeout=1)
+    assert not still_running
+    # The transition swallows CancelledError, so cancelled() stays False
+    assert all(task.cancelling() for task in superseded)
+    assert not surviving.done()
+    sent_before_release = mock_bravia_quad_client.async_set_volume.call_count
+    assert sent_before_release == len(tasks)
+
+    # Let the surviving transition run to completion
+    release_steps.set()
+    await hass.async_block_till_done()
 
-@pytest.fixture
-def platforms_no_subwoofer() -> list[Platform]:
-    """Return the platforms to be loaded for this test."""
-    return [Platform.NUMBER]
+    # Only the last transition sends further steps, ending on its target
+    sent = [
+        call.args[0] for call in mock_bravia_quad_client.async_set_volume.call_args_list
+    ]
+    first_step = sent[sent_before_release - 1]
+    assert sent[sent_before_release - 1 :] == list(range(first_step, 81))
+    assert volume_entity._transition_task is None
 
 
-@pytest.mark.usefixtures("mock_bravia_quad_client")
+@pytest.mark.usefixtures("init_integration_no_subwoofer")
 async def test_bass_level_not_created_without_subwoofer(
     hass: HomeAssistant,
-    mock_config_entry_no_subwoofer: MockConfigEntry,
-    platforms_no_subwoofer: list[Platform],
     entity_registry: er.EntityRegistry,
 ) -> None:
     """Test that bass level slider is not created without subwoofer."""
-    mock_config_entry_no_subwoofer.add_to_hass(hass)
-
-    with patch("custom_components.bravia_quad.PLATFORMS", platforms_no_subwoofer):
-        await hass.config_entries.async_setup(mock_config_entry_no_subwoofer.entry_id)
-        await hass.async_block_till_done()
-
     # Bass level slider should NOT exist when subwoofer is not present
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_bass_level_slider")
     assert entity_id is None
 
 
-@pytest.mark.usefixtures("init_integration_volume")
 async def test_volume_step_interval_cancellation_on_remove(
     hass: HomeAssistant,
     mock_bravia_quad_client: MagicMock,
     entity_registry: er.EntityRegistry,
+    volume_entity: BraviaQuadVolumeNumber,
 ) -> None:
     """Test volume transition is cancelled when entity is removed."""
-    volume_id = get_entity_id_by_unique_id_suffix(entity_registry, "_volume")
+    volume_id = volume_entity.entity_id
     interval_id = get_entity_id_by_unique_id_suffix(
         entity_registry, "_volume_step_interval"
     )
@@ -332,9 +285,11 @@ async def test_volume_step_interval_cancellation_on_remove(
 
     # Track if transition was cancelled
     cancelled = False
+    step_started = asyncio.Event()
 
     async def mock_set_volume(val: int) -> bool:
         nonlocal cancelled
+        step_started.set()
         try:
             await asyncio.sleep(1)
         except asyncio.CancelledError:
@@ -353,41 +308,37 @@ async def test_volume_step_interval_cancellation_on_remove(
         blocking=False,
     )
 
-    # Give it a moment to start the task
-    await asyncio.sleep(0.05)
+    # Wait for the transition to reach its first volume step
+    await asyncio.wait_for(step_started.wait(), timeout=1)
 
-    # Get the entity object
-    component = hass.data["number"]
-    entity = next(ent for ent in component.entities if ent.entity_id == volume_id)
-
-    assert entity._transition_task is not None
-    task = entity._transition_task
+    assert volume_entity._transition_task is not None
+    task = volume_entity._transition_task
 
     # Remove the entity (simulating removal from HA)
-    await entity.async_will_remove_from_hass()
+    await volume_entity.async_will_remove_from_hass()
 
     # Wait for the task to be cancelled
     with contextlib.suppress(asyncio.CancelledError):
-        await asyncio.wait_for(task, timeout=0.1)
+        await task
 
     # The task should be cancelled
     assert task.cancelled() or task.done()
-    assert entity._transition_task is None
+    assert volume_entity._transition_task is None
     assert cancelled is True
 
 
-@pytest.mark.usefixtures("init_integration_volume")
+@pytest.mark.usefixtures("mock_transition_sleep")
 async def test_volume_slider_does_not_update_during_transition(
     hass: HomeAssistant,
     mock_bravia_quad_client: MagicMock,
     entity_registry: er.EntityRegistry,
+    volume_entity: BraviaQuadVolumeNumber,
 ) -> None:
     """Test that slider doesn't update from notifications during transition."""
-    volume_id = get_entity_id_by_unique_id_suffix(entity_registry, "_volume")
+    volume_id = volume_entity.entity_id
     interval_id = get_entity_id_by_unique_id_suffix(
         entity_registry, "_volume_step_interval"
     )
-    assert volume_id is not None
     assert interval_id is not None
 
     # Set interval to 100ms
@@ -398,16 +349,11 @@ async def test_volume_slider_does_not_update_during_transition(
         blocking=True,
     )
 
-    # Get the entity object to access internal state and notification handler
-    component = hass.data["number"]
-    entity = next(ent for ent in component.entities if ent.entity_id == volume_id)
-
-    # Control when volume steps complete
-    step_event = asyncio.Event()
+    # Hold the transition on its first step until released
+    steps_released = asyncio.Event()
 
     async def slow_set_volume(val: int) -> bool:
-        await step_event.wait()
-        step_event.clear()
+        await steps_released.wait()
         return True
 
     mock_bravia_quad_client.async_set_volume.side_effect = slow_set_volume
@@ -426,11 +372,11 @@ async def test_volume_slider_does_not_update_during_transition(
     assert state.state == "53"
 
     # Verify transition is in progress
-    assert entity.should_suppress_volume_notification() is True
+    assert volume_entity.should_suppress_volume_notification() is True
 
     # Simulate device sending back notification with intermediate value
     # This should be ignored during transition
-    await entity._on_notification(51)
+    await volume_entity._on_notification(51)
 
     # State should still be target value, not the notification value
     state = hass.states.get(volume_id)
@@ -438,26 +384,23 @@ async def test_volume_slider_does_not_update_during_transition(
     assert state.state == "53"
 
     # Complete all steps
-    for _ in range(3):
-        step_event.set()
-        await asyncio.sleep(0.15)  # Wait for sleep + step
-
+    steps_released.set()
     await hass.async_block_till_done()
 
     # Transition should be complete
-    assert entity._transition_in_progress is False
+    assert volume_entity._transition_in_progress is False
 
     # Advance past the grace period so notifications are accepted again
-    entity._notification_suppressed_until = 0.0
+    volume_entity._notification_suppressed_until = 0.0
 
     # Now notifications should update the state
-    await entity._on_notification(55)
+    await volume_entity._on_notification(55)
     state = hass.states.get(volume_id)
     assert state is not None
     assert state.state == "55"
 
 
-@pytest.mark.usefixtures("init_integration_volume")
+@pytest.mark.usefixtures("init_integration_volume", "mock_transition_sleep")
 async def test_volume_transition_sets_target_immediately(
     hass: HomeAssistant,
     mock_bravia_quad_client: MagicMock,
@@ -493,39 +436,35 @@ async def test_volume_transition_sets_target_immediately(
     assert state is not None
     assert state.state == "50"
 
-    with patch(
-        "custom_components.bravia_quad.entity.asyncio.sleep", new_callable=AsyncMock
-    ):
-        # Start transition to 60
-        await hass.services.async_call(
-            NUMBER_DOMAIN,
-            "set_value",
-            {ATTR_ENTITY_ID: volume_id, "value": 60},
-            blocking=True,
-        )
+    # Start transition to 60
+    await hass.services.async_call(
+        NUMBER_DOMAIN,
+        "set_value",
+        {ATTR_ENTITY_ID: volume_id, "value": 60},
+        blocking=True,
+    )
 
-        # State should immediately be 60 (the target), not 50
-        state = hass.states.get(volume_id)
-        assert state is not None
-        assert state.state == "60"
+    # State should immediately be 60 (the target), not 50
+    state = hass.states.get(volume_id)
+    assert state is not None
+    assert state.state == "60"
 
-        # Unblock and cleanup
-        volume_blocked.set()
-        await hass.async_block_till_done()
+    # Unblock and cleanup
+    volume_blocked.set()
+    await hass.async_block_till_done()
 
 
-@pytest.mark.usefixtures("init_integration_volume")
 async def test_volume_transition_flag_reset_on_cancel(
     hass: HomeAssistant,
     mock_bravia_quad_client: MagicMock,
     entity_registry: er.EntityRegistry,
+    volume_entity: BraviaQuadVolumeNumber,
 ) -> None:
     """Test transition_in_progress flag is reset when transition is cancelled."""
-    volume_id = get_entity_id_by_unique_id_suffix(entity_registry, "_volume")
+    volume_id = volume_entity.entity_id
     interval_id = get_entity_id_by_unique_id_suffix(
         entity_registry, "_volume_step_interval"
     )
-    assert volume_id is not None
     assert interval_id is not None
 
     # Set interval to 500ms
@@ -545,10 +484,6 @@ async def test_volume_transition_flag_reset_on_cancel(
 
     mock_bravia_quad_client.async_set_volume.side_effect = blocked_set_volume
 
-    # Get the entity object
-    component = hass.data["number"]
-    entity = next(ent for ent in component.entities if ent.entity_id == volume_id)
-
     # Start first transition
     await hass.services.async_call(
         NUMBER_DOMAIN,
@@ -557,14 +492,13 @@ async def test_volume_transition_flag_reset_on_cancel(
         blocking=True,
     )
 
-    assert entity._transition_in_progress is True
+    assert volume_entity._transition_in_progress is True
 
     # Notifications should be suppressed during active transition
-    assert entity.should_suppress_volume_notification() is True
+    assert volume_entity.should_suppress_volume_notification() is True
 
     # Start second transition (should cancel the first)
     mock_bravia_quad_client.async_set_volume.reset_mock()
-    mock_bravia_quad_client.async_set_volume.return_value = True
     mock_bravia_quad_client.async_set_volume.side_effect = None
 
     # This new call with interval=0 should just set directly
@@ -583,56 +517,47 @@ async def test_volume_transition_flag_reset_on_cancel(
     )
 
     # With interval=0, no transition should be in progress
-    assert entity._transition_in_progress is False
+    assert volume_entity._transition_in_progress is False
 
     # Cleanup
     volume_blocked.set()
     await hass.async_block_till_done()
 
 
-@pytest.mark.usefixtures("init_integration_volume")
+@pytest.mark.usefixtures("mock_transition_sleep")
 async def test_volume_notification_accepted_after_transition(
     hass: HomeAssistant,
     mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
+    volume_entity: BraviaQuadVolumeNumber,
 ) -> None:
     """Test notifications are accepted after transition completes."""
-    volume_id = get_entity_id_by_unique_id_suffix(entity_registry, "_volume")
-    assert volume_id is not None
+    volume_id = volume_entity.entity_id
 
     # Set interval directly on the mock client
     mock_bravia_quad_client.volume_step_interval = 10
-    mock_bravia_quad_client.async_set_volume.return_value = True
-
-    # Get the entity object
-    component = hass.data["number"]
-    entity = next(ent for ent in component.entities if ent.entity_id == volume_id)
 
     # Start transition from 50 to 52 (2 steps)
-    with patch(
-        "custom_components.bravia_quad.entity.asyncio.sleep", new_callable=AsyncMock
-    ):
-        await hass.services.async_call(
-            NUMBER_DOMAIN,
-            "set_value",
-            {ATTR_ENTITY_ID: volume_id, "value": 52},
-            blocking=True,
-        )
-        # Wait for the transition task to complete within the patch context
-        if entity._transition_task:
-            await entity._transition_task
+    await hass.services.async_call(
+        NUMBER_DOMAIN,
+        "set_value",
+        {ATTR_ENTITY_ID: volume_id, "value": 52},
+        blocking=True,
+    )
+    # Wait for the transition task to complete
+    if volume_entity._transition_task:
+        await volume_entity._transition_task
 
     # Transition should be complete
-    assert entity._transition_in_progress is False
+    assert volume_entity._transition_in_progress is False
 
     # Notifications should still be suppressed during grace period
-    assert entity.should_suppress_volume_notification() is True
+    assert volume_entity.should_suppress_volume_notification() is True
 
     # Advance past the grace period
-    entity._notification_suppressed_until = 0.0
+    volume_entity._notification_suppressed_until = 0.0
 
     # Now a notification should update the state
-    await entity._on_notification(45)
+    await volume_entity._on_notification(45)
     state = hass.states.get(volume_id)
     assert state is not None
     assert state.state == "45"
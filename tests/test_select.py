@@ -3,21 +3,16 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
-from homeassistant.const import ATTR_ENTITY_ID, CONF_HOST, Platform
+from homeassistant.const import ATTR_ENTITY_ID, Platform
 from homeassistant.helpers import entity_registry as er
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.bravia_quad.const import (
-    CONF_HAS_SUBWOOFER,
-    CONF_TRANSPORT,
-    DOMAIN,
-    TRANSPORT_TCP,
-)
+from custom_components.bravia_quad.const import CONF_HAS_SUBWOOFER
 
-from .conftest import get_entity_id_by_unique_id_suffix
+from .conftest import get_entity_id_by_unique_id_suffix, get_registered_callback
 
 if TYPE_CHECKING:
     from unittest.mock import MagicMock
@@ -33,22 +28,6 @@ def platforms() -> list[Platform]:
     return [Platform.SELECT]
 
 
-@pytest.fixture
-def mock_config_entry_no_subwoofer() -> MockConfigEntry:
-    """Return a mocked config entry without subwoofer."""
-    return MockConfigEntry(
-        title="Bravia Quad",
-        domain=DOMAIN,
-        data={
-            CONF_HOST: "192.168.1.100",
-            CONF_HAS_SUBWOOFER: False,
-            CONF_TRANSPORT: TRANSPORT_TCP,
-        },
-        unique_id="192.168.1.100",
-        entry_id="test_entry_id_no_sub",
-    )
-
-
 # =============================================================================
 # Select entity setup
 # =============================================================================
@@ -116,8 +95,6 @@ async def test_drc_select_options(
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_drc")
     assert entity_id is not None
 
-    mock_bravia_quad_client.async_set_drc.return_value = True
-
     await hass.services.async_call(
         SELECT_DOMAIN,
         "select_option",
@@ -166,14 +143,7 @@ async def test_drc_notification_updates_state(
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_drc")
     assert entity_id is not None
 
-    # Find the DRC callback (third registered callback - after input and bass_level)
-    # The order depends on entity registration
-    callbacks = mock_bravia_quad_client.register_notification_callback.call_args_list
-    drc_callback = None
-    for call in callbacks:
-        if call[0][0] == "audio.drangecomp":
-            drc_callback = call[0][1]
-            break
+    drc_callback = get_registered_callback(mock_bravia_quad_client, "audio.drangecomp")
 
     assert drc_callback is not None, "DRC callback not found"
 
@@ -195,12 +165,7 @@ async def test_drc_notification_unknown_value(
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_drc")
     assert entity_id is not None
 
-    callbacks = mock_bravia_quad_client.register_notification_callback.call_args_list
-    drc_callback = None
-    for call in callbacks:
-        if call[0][0] == "audio.drangecomp":
-            drc_callback = call[0][1]
-            break
+    drc_callback = get_registered_callback(mock_bravia_quad_client, "audio.drangecomp")
 
     assert drc_callback is not None
 
@@ -221,18 +186,12 @@ async def test_drc_notification_unknown_value(
 # =============================================================================
 
 
+@pytest.mark.usefixtures("init_integration_no_subwoofer")
 async def test_bass_level_select_created_without_subwoofer(
     hass: HomeAssistant,
-    mock_config_entry_no_subwoofer: MockConfigEntry,
     mock_bravia_quad_client: MagicMock,
 ) -> None:
     """Test bass level select is created when no subwoofer is detected."""
-    mock_config_entry_no_subwoofer.add_to_hass(hass)
-
-    with patch("custom_components.bravia_quad.PLATFORMS", [Platform.SELECT]):
-        await hass.config_entries.async_setup(mock_config_entry_no_subwoofer.entry_id)
-        await hass.async_block_till_done()
-
     entity_registry = er.async_get(hass)
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_bass_level_select")
     assert entity_id is not None, "Bass level select entity not found"
@@ -243,19 +202,11 @@ async def test_bass_level_select_created_without_subwoofer(
     assert state.state == "min"
 
 
+@pytest.mark.usefixtures("init_integration")
 async def test_bass_level_select_not_created_with_subwoofer(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-    mock_bravia_quad_client: MagicMock,
+    entity_registry: er.EntityRegistry,
 ) -> None:
     """Test bass level select is NOT created when subwoofer is detected."""
-    mock_config_entry.add_to_hass(hass)
-
-    with patch("custom_components.bravia_quad.PLATFORMS", [Platform.SELECT]):
-        await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-    entity_registry = er.async_get(hass)
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_bass_level_select")
     assert entity_id is None, "Bass level select should not exist with subwoofer"
 
@@ -269,26 +220,18 @@ async def test_bass_level_select_not_created_with_subwoofer(
     ],
     ids=["min", "mid", "max"],
 )
+@pytest.mark.usefixtures("init_integration_no_subwoofer")
 async def test_bass_level_select_options(
     hass: HomeAssistant,
-    mock_config_entry_no_subwoofer: MockConfigEntry,
     mock_bravia_quad_client: MagicMock,
     option: str,
     expected_value: int,
 ) -> None:
     """Test selecting bass level options."""
-    mock_config_entry_no_subwoofer.add_to_hass(hass)
-
-    with patch("custom_components.bravia_quad.PLATFORMS", [Platform.SELECT]):
-        await hass.config_entries.async_setup(mock_config_entry_no_subwoofer.entry_id)
-        await hass.async_block_till_done()
-
     entity_registry = er.async_get(hass)
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_bass_level_select")
     assert entity_id is not None
 
-    mock_bravia_quad_client.async_set_bass_level.return_value = True
-
     await hass.services.async_call(
         SELECT_DOMAIN,
         "select_option",
@@ -299,18 +242,12 @@ async def test_bass_level_select_options(
     mock_bravia_quad_client.async_set_bass_level.assert_called_once_with(expected_value)
 
 
+@pytest.mark.usefixtures("init_integration_no_subwoofer")
 async def test_bass_level_select_fails(
     hass: HomeAssistant,
-    mock_config_entry_no_subwoofer: MockConfigEntry,
     mock_bravia_quad_client: MagicMock,
 ) -> None:
     """Test bass level select when API call fails."""
-    mock_config_entry_no_subwoofer.add_to_hass(hass)
-
-    with patch("custom_components.bravia_quad.PLATFORMS", [Platform.SELECT]):
-        await hass.config_entries.async_setup(mock_config_entry_no_subwoofer.entry_id)
-        await hass.async_block_till_done()
-
     entity_registry = er.async_get(hass)
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_bass_level_select")
     assert entity_id is not None
@@ -333,29 +270,17 @@ async def test_bass_level_select_fails(
     assert state.state == initial_state.state
 
 
+@pytest.mark.usefixtures("init_integration_no_subwoofer")
 async def test_bass_level_notification_updates_state(
     hass: HomeAssistant,
-    mock_config_entry_no_subwoofer: MockConfigEntry,
     mock_bravia_quad_client: MagicMock,
 ) -> None:
     """Test bass level notification updates entity state."""
-    mock_config_entry_no_subwoofer.add_to_hass(hass)
-
-    with patch("custom_components.bravia_quad.PLATFORMS", [Platform.SELECT]):
-        await hass.config_entries.async_setup(mock_config_entry_no_subwoofer.entry_id)
-        await hass.async_block_till_done()
-
     entity_registry = er.async_get(hass)
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_bass_level_select")
     assert entity_id is not None
 
-    # Find the bass level callback
-    callbacks = mock_bravia_quad_client.register_notification_callback.call_args_list
-    bass_callback = None
-    for call in callbacks:
-        if call[0][0] == "main.bassstep":
-            bass_callback = call[0][1]
-            break
+    bass_callback = get_registered_callback(mock_bravia_quad_client, "main.bassstep")
 
     assert bass_callback is not None, "Bass level callback not found"
 
@@ -367,28 +292,17 @@ async def test_bass_level_notification_updates_state(
     assert state.state == "max"
 
 
+@pytest.mark.usefixtures("init_integration_no_subwoofer")
 async def test_bass_level_notification_invalid_value(
     hass: HomeAssistant,
-    mock_config_entry_no_subwoofer: MockConfigEntry,
     mock_bravia_quad_client: MagicMock,
 ) -> None:
     """Test bass level notification with invalid (non-numeric) value."""
-    mock_config_entry_no_subwoofer.add_to_hass(hass)
-
-    with patch("custom_components.bravia_quad.PLATFORMS", [Platform.SELECT]):
-        await hass.config_entries.async_setup(mock_config_entry_no_subwoofer.entry_id)
-        await hass.async_block_till_done()
-
     entity_registry = er.async_get(hass)
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_bass_level_select")
     assert entity_id is not None
 
-    callbacks = mock_bravia_quad_client.register_notification_callback.call_args_list
-    bass_callback = None
-    for call in callbacks:
-        if call[0][0] == "main.bassstep":
-            bass_callback = call[0][1]
-            break
+    bass_callback = get_registered_callback(mock_bravia_quad_client, "main.bassstep")
 
     assert bass_callback is not None
 
@@ -406,27 +320,16 @@ async def test_bass_level_notification_invalid_value(
 
 async def test_bass_level_subwoofer_detection_triggers_reload(
     hass: HomeAssistant,
-    mock_config_entry_no_subwoofer: MockConfigEntry,
+    init_integration_no_subwoofer: MockConfigEntry,
     mock_bravia_quad_client: MagicMock,
     mock_bravia_http_client: MagicMock,
 ) -> None:
     """Test bass level value outside 0-2 triggers subwoofer detection reload."""
-    mock_config_entry_no_subwoofer.add_to_hass(hass)
-
-    with patch("custom_components.bravia_quad.PLATFORMS", [Platform.SELECT]):
-        await hass.config_entries.async_setup(mock_config_entry_no_subwoofer.entry_id)
-        await hass.async_block_till_done()
-
     entity_registry = er.async_get(hass)
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_bass_level_select")
     assert entity_id is not None
 
-    callbacks = mock_bravia_quad_client.register_notification_callback.call_args_list
-    bass_callback = None
-    for call in callbacks:
-        if call[0][0] == "main.bassstep":
-            bass_callback = call[0][1]
-            break
+    bass_callback = get_registered_callback(mock_bravia_quad_client, "main.bassstep")
 
     assert bass_callback is not None
 
@@ -435,7 +338,7 @@ async def test_bass_level_subwoofer_detection_triggers_reload(
     await hass.async_block_till_done()
 
     # Entry should now have subwoofer detected
-    entry = hass.config_entries.async_get_entry(mock_config_entry_no_subwoofer.entry_id)
+    entry = hass.config_entries.async_get_entry(init_integration_no_subwoofer.entry_id)
     assert entry is not None
     assert entry.data.get(CONF_HAS_SUBWOOFER) is True
 
@@ -465,22 +368,41 @@ async def test_new_select_entities(
 
 
 @pytest.mark.usefixtures("init_integration")
-async def test_hdmi_passthrough_select_option(
+@pytest.mark.parametrize(
+    ("feature", "option"),
+    [
+        ("hdmi_passthrough", "on"),
+        ("audio_return_channel", "off"),
+        ("bt_connection_quality", "priorityconnection"),
+    ],
+)
+async def test_select_option_verified(
     hass: HomeAssistant,
     mock_bravia_quad_client: MagicMock,
     entity_registry: er.EntityRegistry,
+    feature: str,
+    option: str,
 ) -> None:
-    """Test selecting HDMI passthrough option."""
-    mock_bravia_quad_client.async_get_hdmi_passthrough = AsyncMock(return_value="on")
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_hdmi_passthrough")
+    """Test selecting an option the device keeps on re-read."""
+    setattr(
+        mock_bravia_quad_client,
+        f"async_get_{feature}",
+        AsyncMock(return_value=option),
+    )
+    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, f"_{feature}")
     assert entity_id is not None
     await hass.services.async_call(
         "select",
         "select_option",
-        {"entity_id": entity_id, "option": "on"},
+        {"entity_id": entity_id, "option": option},
         blocking=True,
     )
-    mock_bravia_quad_client.async_set_hdmi_passthrough.assert_called_once_with("on")
+    getattr(mock_bravia_quad_client, f"async_set_{feature}").assert_called_once_with(
+        option
+    )
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == option
 
 
 @pytest.mark.usefixtures("init_integration_all")
@@ -502,59 +424,6 @@ async def test_dual_mono_select_option(
     mock_bravia_quad_client.async_set_dual_mono.assert_called_once_with("sub")
 
 
-@pytest.mark.usefixtures("init_integration")
-async def test_audio_return_channel_select_option(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test selecting a stable audio return channel option with re-read."""
-    mock_bravia_quad_client.async_get_audio_return_channel = AsyncMock(
-        return_value="off"
-    )
-    entity_id = get_entity_id_by_unique_id_suffix(
-        entity_registry, "_audio_return_channel"
-    )
-    assert entity_id is not None
-    await hass.services.async_call(
-        "select",
-        "select_option",
-        {"entity_id": entity_id, "option": "off"},
-        blocking=True,
-    )
-    mock_bravia_quad_client.async_set_audio_return_channel.assert_called_once_with(
-        "off"
-    )
-    state = hass.states.get(entity_id)
-    assert state is not None
-    assert state.state == "off"
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_bt_connection_quality_select_option(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test selecting Bluetooth connection quality."""
-    mock_bravia_quad_client.async_get_bt_connection_quality = AsyncMock(
-        return_value="priorityconnection"
-    )
-    entity_id = get_entity_id_by_unique_id_suffix(
-        entity_registry, "_bt_connection_quality"
-    )
-    assert entity_id is not None
-    await hass.services.async_call(
-        "select",
-        "select_option",
-        {"entity_id": entity_id, "option": "priorityconnection"},
-        blocking=True,
-    )
-    mock_bravia_quad_client.async_set_bt_connection_quality.assert_called_once_with(
-        "priorityconnection"
-    )
-
-
 @pytest.mark.usefixtures("init_integration")
 async def test_imax_mode_select_shows_auto(
     hass: HomeAssistant,
@@ -62,6 +62,16 @@ async def test_switch_entities(
         assert state is None, f"Expected {suffix} to be disabled"
 
 
+@pytest.mark.usefixtures("init_integration")
+async def test_cached_switches_skip_initial_read(
+    mock_bravia_quad_client: MagicMock,
+) -> None:
+    """Test switches seeded from the sticky cache are not re-read at setup."""
+    mock_bravia_quad_client.async_get_night_mode.assert_not_called()
+    mock_bravia_quad_client.async_get_hdmi_cec.assert_not_called()
+    mock_bravia_quad_client.async_get_net_bt_standby.assert_awaited()
+
+
 @pytest.mark.usefixtures("init_integration_all")
 async def test_power_switch_turn_on(
     hass: HomeAssistant,
@@ -78,7 +88,6 @@ async def test_power_switch_turn_on(
 
     # Set power to off, then turn on
     mock_bravia_quad_client.power_state = "off"
-    mock_bravia_quad_client.async_set_power.return_value = True
 
     await hass.services.async_call(
         SWITCH_DOMAIN,
@@ -100,8 +109,6 @@ async def test_power_switch_turn_off(
     entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_power")
     assert entity_id is not None
 
-    mock_bravia_quad_client.async_set_power.return_value = True
-
     await hass.services.async_call(
         SWITCH_DOMAIN,
         SERVICE_TURN_OFF,
@@ -113,272 +120,47 @@ async def test_power_switch_turn_off(
 
 
 @pytest.mark.usefixtures("init_integration")
-async def test_hdmi_cec_switch_turn_on(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test turning on the HDMI CEC switch."""
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_hdmi_cec")
-    assert entity_id is not None
-
-    mock_bravia_quad_client.async_set_hdmi_cec.return_value = True
-
-    await hass.services.async_call(
-        SWITCH_DOMAIN,
-        SERVICE_TURN_ON,
-        {ATTR_ENTITY_ID: entity_id},
-        blocking=True,
-    )
-
-    mock_bravia_quad_client.async_set_hdmi_cec.assert_called_once_with("on")
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_hdmi_cec_switch_turn_off(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test turning off the HDMI CEC switch."""
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_hdmi_cec")
-    assert entity_id is not None
-
-    mock_bravia_quad_client.async_set_hdmi_cec.return_value = True
-
-    await hass.services.async_call(
-        SWITCH_DOMAIN,
-        SERVICE_TURN_OFF,
-        {ATTR_ENTITY_ID: entity_id},
-        blocking=True,
-    )
-
-    mock_bravia_quad_client.async_set_hdmi_cec.assert_called_once_with("off")
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_auto_standby_switch_turn_on(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test turning on the auto standby switch."""
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_auto_standby")
-    assert entity_id is not None
-
-    mock_bravia_quad_client.async_set_auto_standby.return_value = True
-
-    await hass.services.async_call(
-        SWITCH_DOMAIN,
-        SERVICE_TURN_ON,
-        {ATTR_ENTITY_ID: entity_id},
-        blocking=True,
-    )
-
-    mock_bravia_quad_client.async_set_auto_standby.assert_called_once_with("on")
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_voice_enhancer_switch_turn_on(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test turning on the voice enhancer switch."""
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_voice_enhancer")
-    assert entity_id is not None
-
-    mock_bravia_quad_client.async_set_voice_enhancer.return_value = True
-
-    await hass.services.async_call(
-        SWITCH_DOMAIN,
-        SERVICE_TURN_ON,
-        {ATTR_ENTITY_ID: entity_id},
-        blocking=True,
-    )
-
-    mock_bravia_quad_client.async_set_voice_enhancer.assert_called_once_with("upon")
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_sound_field_switch_turn_on(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test turning on the sound field switch."""
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_sound_field")
-    assert entity_id is not None
-
-    mock_bravia_quad_client.async_set_sound_field.return_value = True
-
-    await hass.services.async_call(
-        SWITCH_DOMAIN,
-        SERVICE_TURN_ON,
-        {ATTR_ENTITY_ID: entity_id},
-        blocking=True,
-    )
-
-    mock_bravia_quad_client.async_set_sound_field.assert_called_once_with("on")
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_night_mode_switch_turn_on(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test turning on the night mode switch."""
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_night_mode")
-    assert entity_id is not None
-
-    mock_bravia_quad_client.async_set_night_mode.return_value = True
-
-    await hass.services.async_call(
-        SWITCH_DOMAIN,
-        SERVICE_TURN_ON,
-        {ATTR_ENTITY_ID: entity_id},
-        blocking=True,
-    )
-
-    mock_bravia_quad_client.async_set_night_mode.assert_called_once_with("on")
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_auto_standby_switch_turn_off(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test turning off the auto standby switch."""
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_auto_standby")
-    assert entity_id is not None
-
-    mock_bravia_quad_client.async_set_auto_standby.return_value = True
-
-    await hass.services.async_call(
-        SWITCH_DOMAIN,
-        SERVICE_TURN_OFF,
-        {ATTR_ENTITY_ID: entity_id},
-        blocking=True,
-    )
-
-    mock_bravia_quad_client.async_set_auto_standby.assert_called_once_with("off")
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_voice_enhancer_switch_turn_off(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test turning off the voice enhancer switch."""
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_voice_enhancer")
-    assert entity_id is not None
-
-    mock_bravia_quad_client.async_set_voice_enhancer.return_value = True
-
-    await hass.services.async_call(
-        SWITCH_DOMAIN,
-        SERVICE_TURN_OFF,
-        {ATTR_ENTITY_ID: entity_id},
-        blocking=True,
-    )
-
-    mock_bravia_quad_client.async_set_voice_enhancer.assert_called_once_with("upoff")
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_sound_field_switch_turn_off(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test turning off the sound field switch."""
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_sound_field")
-    assert entity_id is not None
-
-    mock_bravia_quad_client.async_set_sound_field.return_value = True
-
-    await hass.services.async_call(
-        SWITCH_DOMAIN,
-        SERVICE_TURN_OFF,
-        {ATTR_ENTITY_ID: entity_id},
-        blocking=True,
-    )
-
-    mock_bravia_quad_client.async_set_sound_field.assert_called_once_with("off")
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_night_mode_switch_turn_off(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test turning off the night mode switch."""
-    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, "_night_mode")
-    assert entity_id is not None
-
-    mock_bravia_quad_client.async_set_night_mode.return_value = True
-
-    await hass.services.async_call(
-        SWITCH_DOMAIN,
-        SERVICE_TURN_OFF,
-        {ATTR_ENTITY_ID: entity_id},
-        blocking=True,
-    )
-
-    mock_bravia_quad_client.async_set_night_mode.assert_called_once_with("off")
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_advanced_auto_volume_switch_turn_on(
+@pytest.mark.parametrize(
+    ("suffix", "service", "client_method", "expected_arg"),
+    [
+        ("_hdmi_cec", SERVICE_TURN_ON, "async_set_hdmi_cec", "on"),
+        ("_hdmi_cec", SERVICE_TURN_OFF, "async_set_hdmi_cec", "off"),
+        ("_auto_standby", SERVICE_TURN_ON, "async_set_auto_standby", "on"),
+        ("_auto_standby", SERVICE_TURN_OFF, "async_set_auto_standby", "off"),
+        ("_voice_enhancer", SERVICE_TURN_ON, "async_set_voice_enhancer", "upon"),
+        ("_voice_enhancer", SERVICE_TURN_OFF, "async_set_voice_enhancer", "upoff"),
+        ("_sound_field", SERVICE_TURN_ON, "async_set_sound_field", "on"),
+        ("_sound_field", SERVICE_TURN_OFF, "async_set_sound_field", "off"),
+        ("_night_mode", SERVICE_TURN_ON, "async_set_night_mode", "on"),
+        ("_night_mode", SERVICE_TURN_OFF, "async_set_night_mode", "off"),
+        ("_advanced_auto_volume", SERVICE_TURN_ON, "async_set_aav", "on"),
+        ("_advanced_auto_volume", SERVICE_TURN_OFF, "async_set_aav", "off"),
+    ],
+)
+async def test_switch_turn_on_off(
     hass: HomeAssistant,
     mock_bravia_quad_client: MagicMock,
     entity_registry: er.EntityRegistry,
+    suffix: str,
+    service: str,
+    client_method: str,
+    expected_arg: str,
 ) -> None:
-    """Test turning on the advanced auto volume switch."""
-    entity_id = get_entity_id_by_unique_id_suffix(
-        entity_registry, "_advanced_auto_volume"
-    )
+    """Test switch services send the matching device value."""
+    entity_id = get_entity_id_by_unique_id_suffix(entity_registry, suffix)
     assert entity_id is not None
 
-    mock_bravia_quad_client.async_set_aav.return_value = True
-
     await hass.services.async_call(
         SWITCH_DOMAIN,
-        SERVICE_TURN_ON,
+        service,
         {ATTR_ENTITY_ID: entity_id},
         blocking=True,
     )
 
-    mock_bravia_quad_client.async_set_aav.assert_called_once_with("on")
-
-
-@pytest.mark.usefixtures("init_integration")
-async def test_advanced_auto_volume_switch_turn_off(
-    hass: HomeAssistant,
-    mock_bravia_quad_client: MagicMock,
-    entity_registry: er.EntityRegistry,
-) -> None:
-    """Test turning off the advanced auto volume switch."""
-    entity_id = get_entity_id_by_unique_id_suffix(
-        entity_registry, "_advanced_auto_volume"
-    )
-    assert entity_id is not None
-
-    mock_bravia_quad_client.async_set_aav.return_value = True
-
-    await hass.services.async_call(
-        SWITCH_DOMAIN,
-        SERVICE_TURN_OFF,
-        {ATTR_ENTITY_ID: entity_id},
-        blocking=True,
+    getattr(mock_bravia_quad_client, client_method).assert_called_once_with(
+        expected_arg
     )
 
-    mock_bravia_quad_client.async_set_aav.assert_called_once_with("off")
-
 
 @pytest.mark.usefixtures("init_integration")
 async def test_new_switch_entities(